@@ -0,0 +1,162 @@
+"""
+application_io.py
+CSV and JSON import/export of applications for the bot's /import and /export.
+
+Imports are read and validated one row at a time and handed on in batches
+of IMPORT_BATCH_SIZE, each written with a single multi-row insert, so a
+few hundred applications take a couple of requests. Exports are written
+page by page as the replica yields them.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+from applications_store import STATUSES
+from config import IMPORT_BATCH_SIZE, IMPORT_MAX_ROWS
+
+FORMATS = ("csv", "json")
+# Every imported row carries all of these: a multi-row insert needs the
+# same keys on every object
+FIELDS = ("company", "role", "status", "date", "interview_date", "notes")
+EXPORT_FIELDS = ("id",) + FIELDS + ("updated_at",)
+MAX_TEXT = 200
+
+
+# ============================================================
+# IMPORT
+# ============================================================
+
+def read_rows(data, filename=""):
+    """
+    Yield (line number, raw dict) from a CSV, JSON array or JSON Lines
+    document. The format comes from the file extension, else the first
+    character. Raises ValueError if the document can't be parsed.
+    """
+    try:
+        text = bytes(data).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError("the file isn't UTF-8 text")
+    name = (filename or "").lower()
+    first = text.lstrip()[:1]
+
+    if name.endswith((".jsonl", ".ndjson")) or (first == "{" and not name.endswith(".csv")):
+        for number, line in enumerate(text.splitlines(), 1):
+            if line.strip():
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield number, ValueError(f"invalid JSON ({e.msg})")
+    elif name.endswith(".json") or first == "[":
+        try:
+            rows = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid JSON at line {e.lineno} ({e.msg})")
+        if not isinstance(rows, list):
+            raise ValueError("expected a JSON array of applications")
+        yield from enumerate(rows, 1)
+    else:
+        reader = csv.DictReader(io.StringIO(text, newline=""))
+        header = {f.strip().lower() for f in reader.fieldnames or ()}
+        if not {"company", "role"} <= header:
+            raise ValueError("the CSV needs a header row with at least company and role")
+        for raw in reader:
+            yield reader.line_num, raw
+
+
+def _timestamp(value, field):
+    if value in (None, ""):
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"{field} isn't an ISO date: {value!r}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.isoformat()
+
+
+def _text(value, field, required=False):
+    value = "" if value is None else str(value).strip()
+    if required and not value:
+        raise ValueError(f"{field} is missing")
+    if len(value) > MAX_TEXT and field != "notes":
+        raise ValueError(f"{field} is longer than {MAX_TEXT} characters")
+    return value or None
+
+
+def validate(raw, now=None):
+    """Check one imported row and return it with exactly FIELDS. Raises ValueError."""
+    if isinstance(raw, ValueError):
+        raise raw
+    if not isinstance(raw, dict):
+        raise ValueError("expected an object with company and role")
+    raw = {str(k).strip().lower(): v for k, v in raw.items() if k is not None}
+
+    status = (_text(raw.get("status"), "status") or "applied").lower()
+    if status not in STATUSES:
+        raise ValueError(f"status must be one of {', '.join(STATUSES)}, not {status!r}")
+    return {
+        "company": _text(raw.get("company"), "company", required=True),
+        "role": _text(raw.get("role"), "role", required=True),
+        "status": status,
+        "date": _timestamp(raw.get("date"), "date") or (now or datetime.now(timezone.utc)).isoformat(),
+        "interview_date": _timestamp(raw.get("interview_date"), "interview_date"),
+        "notes": _text(raw.get("notes"), "notes"),
+    }
+
+
+def batches(rows, errors, size=IMPORT_BATCH_SIZE, max_rows=IMPORT_MAX_ROWS):
+    """
+    Validate (line, raw) pairs from read_rows() and yield lists of at most
+    size valid rows. Invalid rows are appended to errors as (line, reason);
+    rows past max_rows are reported once and dropped.
+    """
+    now = datetime.now(timezone.utc)
+    batch, accepted = [], 0
+    for line, raw in rows:
+        if accepted >= max_rows:
+            errors.append((line, f"stopped after {max_rows} rows"))
+            break
+        try:
+            batch.append(validate(raw, now))
+        except ValueError as e:
+            errors.append((line, str(e)))
+            continue
+        accepted += 1
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ============================================================
+# EXPORT
+# ============================================================
+
+async def export(pages, fmt, fh):
+    """
+    Write the rows from the async iterator pages (lists of application
+    dicts) to the binary file fh as fmt. Returns how many were written.
+    """
+    out = io.TextIOWrapper(fh, encoding="utf-8", newline="")
+    written = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, EXPORT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        async for page in pages:
+            writer.writerows(page)
+            written += len(page)
+    else:
+        out.write("[")
+        async for page in pages:
+            for row in page:
+                out.write(",\n" if written else "\n")
+                out.write(json.dumps({f: row.get(f) for f in EXPORT_FIELDS}, ensure_ascii=False))
+                written += 1
+        out.write("\n]\n")
+    out.flush()
+    out.detach()
+    return written
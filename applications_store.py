@@ -0,0 +1,346 @@
+"""
+applications_store.py
+Local SQLite replica of the Supabase applications table.
+
+Reads are served from the replica. Before a read it catches up with
+Supabase by pulling only the rows past the newest (updated_at, id) it
+already holds, paged on that same key, then compares an exact row count with the
+server to pick up rows deleted elsewhere. The catch-up is skipped when
+the last one was under APPLICATIONS_SYNC_SEC ago. Writes go to Supabase
+first, are applied to the replica from the returned rows, and mark it
+stale so the next read syncs.
+
+Company lookups are resolved against an in-memory trigram index of the
+replica (company_index.py) that every upsert and delete keeps current;
+only the chosen application's primary key is sent to Supabase, and only
+when the match is unambiguous.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from company_index import CompanyIndex, unambiguous
+from supabase_client import PostgrestError
+from config import (
+    APPLICATIONS_DB, APPLICATIONS_SYNC_SEC, APPLICATIONS_SYNC_PAGE, EXPORT_PAGE_SIZE,
+)
+
+TABLE = "applications"
+STATUSES = ("applied", "interview", "rejected", "offer")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id         INTEGER PRIMARY KEY,
+    company    TEXT NOT NULL,
+    status     TEXT,
+    date       TEXT,
+    updated_at TEXT,
+    row        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applications_date ON applications (date);
+CREATE INDEX IF NOT EXISTS applications_status ON applications (status);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _utc(value):
+    """Normalize an ISO timestamp to UTC so stored values compare as strings."""
+    if not value:
+        return value
+    return datetime.fromisoformat(value).astimezone(timezone.utc).isoformat()
+
+
+class ApplicationsReplica:
+    def __init__(self, client, path=APPLICATIONS_DB, sync_interval=APPLICATIONS_SYNC_SEC,
+                 page_size=APPLICATIONS_SYNC_PAGE):
+        self.client = client
+        self.sync_interval = sync_interval
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._synced_at = 0.0
+        self._stale = True
+        self._sync_lock = asyncio.Lock()
+        self._companies = None   # Built on the first lookup
+
+    # ------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------
+
+    def _upsert(self, rows, advance=False):
+        """Store rows; advance=True also moves the watermark (sync only)."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO applications (id, company, status, date, updated_at, row) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((r["id"], r["company"], r.get("status"), _utc(r.get("date")),
+                  _utc(r.get("updated_at")), json.dumps(r)) for r in rows),
+            )
+            if self._companies is not None:
+                for r in rows:
+                    self._companies.add(r["id"], r["company"], _utc(r.get("date")))
+            newest = max(((_utc(r["updated_at"]), r["id"], r["updated_at"])
+                          for r in rows if r.get("updated_at")), default=None)
+            # Rows returned by our own writes don't move it, or changes made
+            # elsewhere just before them would be skipped
+            if advance and newest:
+                current = self._watermark()
+                if current is None or newest[:2] > (_utc(current[0]), current[1]):
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                        (("watermark", newest[2]), ("watermark_id", str(newest[1]))),
+                    )
+
+    def _watermark(self):
+        """(updated_at, id) of the newest row pulled, or None; call with _lock held."""
+        state = dict(self._conn.execute(
+            "SELECT key, value FROM sync_state WHERE key IN ('watermark', 'watermark_id')"
+        ))
+        if "watermark" not in state:
+            return None
+        # Replicas synced before the id was kept start from id 0 at that timestamp
+        return state["watermark"], int(state.get("watermark_id", 0))
+
+    def _fresh(self):
+        return not self._stale and time.monotonic() - self._synced_at < self.sync_interval
+
+    async def sync(self, force=False):
+        """Pull rows changed since the watermark. Returns how many were pulled."""
+        if not force and self._fresh():
+            return 0
+        # Concurrent handlers share one catch-up instead of each running their own
+        async with self._sync_lock:
+            if not force and self._fresh():
+                return 0
+            return await self._pull()
+
+    async def _pull(self):
+        pulled = 0
+        while True:
+            params = {"order": "updated_at.asc,id.asc", "limit": self.page_size}
+            with self._lock:
+                watermark = self._watermark()
+            if watermark:
+                # Keyset on (updated_at, id), which migration 001 indexes:
+                # rows sharing the newest timestamp (a bulk import, or the
+                # migration's own default) are paged by id, not pulled again
+                updated_at, app_id = watermark
+                params["or"] = (
+                    f'(updated_at.gt."{updated_at}",'
+                    f'and(updated_at.eq."{updated_at}",id.gt.{app_id}))'
+                )
+            rows = await self.client.select(TABLE, **params)
+            if rows:
+                self._upsert(rows, advance=True)
+            pulled += len(rows)
+            if len(rows) < self.page_size:
+                break
+
+        remote = await self.client.count(TABLE)
+        if remote != self.count_local():
+            await self._reconcile_deletes()
+
+        self._synced_at = time.monotonic()
+        self._stale = False
+        return pulled
+
+    async def _reconcile_deletes(self):
+        """Drop local rows whose IDs no longer exist on the server."""
+        ids, offset = set(), 0
+        while True:
+            rows = await self.client.select(TABLE, select="id", order="id.asc",
+                                            limit=self.page_size, offset=offset)
+            ids.update(r["id"] for r in rows)
+            offset += len(rows)
+            if len(rows) < self.page_size:
+                break
+        with self._lock, self._conn:
+            local = {r[0] for r in self._conn.execute("SELECT id FROM applications")}
+            self._drop(local - ids)
+
+    def _drop(self, ids):
+        """Delete ids from the table and the company index; call with _lock held."""
+        self._conn.executemany("DELETE FROM applications WHERE id = ?", ((i,) for i in ids))
+        if self._companies is not None:
+            for app_id in ids:
+                self._companies.remove(app_id)
+
+    # ------------------------------------------------------------
+    # Writes — Supabase first, then the replica
+    # ------------------------------------------------------------
+
+    async def insert(self, row):
+        rows = await self.client.insert(TABLE, row)
+        self._upsert(rows)
+        self._stale = True
+        return rows
+
+    async def insert_many(self, rows):
+        """One multi-row insert; every row must have the same keys."""
+        return await self.insert(rows)
+
+    async def update(self, app_id, values):
+        rows = await self.client.update(TABLE, {"id": f"eq.{app_id}"}, values)
+        self._upsert(rows)
+        self._stale = True
+        return rows
+
+    async def delete(self, app_id):
+        rows = await self.client.delete(TABLE, {"id": f"eq.{app_id}"})
+        with self._lock, self._conn:
+            self._drop([app_id])
+        self._stale = True
+        return rows
+
+    # ------------------------------------------------------------
+    # Reads — synced first, then answered locally
+    # ------------------------------------------------------------
+
+    def count_local(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+
+    def _rows(self, sql, params=()):
+        with self._lock:
+            return [json.loads(r[0]) for r in self._conn.execute(sql, params)]
+
+    async def all(self):
+        """Every application, newest first."""
+        await self.sync()
+        return self._rows("SELECT row FROM applications ORDER BY date DESC")
+
+    async def count(self, status=None):
+        await self.sync()
+        with self._lock:
+            if status is None:
+                return self._conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM applications WHERE status = ?", (status,)
+            ).fetchone()[0]
+
+    async def stats(self, since):
+        """Total, count since (an aware datetime) and per-status counts, in one pass."""
+        await self.sync()
+        with self._lock:
+            by_status = dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM applications GROUP BY status"
+            ).fetchall())
+            recent = self._conn.execute(
+                "SELECT COUNT(*) FROM applications WHERE date > ?",
+                (since.astimezone(timezone.utc).isoformat(),),
+            ).fetchone()[0]
+        return {"total": sum(by_status.values()), "this_week": recent, "by_status": by_status}
+
+    async def since(self, when):
+        """Applications dated after when (an aware datetime), newest first."""
+        await self.sync()
+        return self._rows(
+            "SELECT row FROM applications WHERE date > ? ORDER BY date DESC",
+            (when.astimezone(timezone.utc).isoformat(),),
+        )
+
+    def candidates(self, company):
+        """
+        Ranked (score, normalized name, application ID) matches for company,
+        from the local index alone. Call sync() first for current results.
+        """
+        with self._lock:
+            if self._companies is None:
+                self._companies = CompanyIndex()
+                for app_id, name, date in self._conn.execute(
+                    "SELECT id, company, date FROM applications"
+                ):
+                    self._companies.add(app_id, name, date)
+            return self._companies.search(company)
+
+    async def pages(self, page_size=EXPORT_PAGE_SIZE):
+        """Every application in ID order, page_size rows at a time."""
+        await self.sync()
+        last = -1
+        while True:
+            page = self._rows(
+                "SELECT row FROM applications WHERE id > ? ORDER BY id LIMIT ?",
+                (last, page_size),
+            )
+            if not page:
+                return
+            yield page
+            last = page[-1]["id"]
+
+    async def find(self, company):
+        """
+        The application a command should act on for company, as (row,
+        candidates). row is the newest application of an exact name, or of
+        the only name company is a prefix of, re-read from Supabase by
+        primary key so the caller acts on its current state. Otherwise row
+        is None and candidates holds the newest application of each name
+        that matched, best first, for the user to choose from.
+        """
+        await self.sync()
+        while True:
+            ranked = self.candidates(company)
+            if not ranked:
+                return None, []
+            if not unambiguous(ranked):
+                ids = [app_id for _, _, app_id in ranked]
+                by_id = {r["id"]: r for r in self._rows(
+                    f"SELECT row FROM applications WHERE id IN ({','.join('?' * len(ids))})", ids,
+                )}
+                return None, [by_id[i] for i in ids if i in by_id]
+            app_id = ranked[0][2]
+            rows = await self.client.select(TABLE, id=f"eq.{app_id}")
+            if rows:
+                self._upsert(rows)
+                return rows[0], []
+            # Deleted elsewhere since the last sync; rank again without it
+            with self._lock, self._conn:
+                self._drop([app_id])
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================
+# SERVER-SIDE QUERIES — for jobs without a long-lived replica
+# ============================================================
+
+async def remote_stats(client, since):
+    """
+    The same shape as ApplicationsReplica.stats(), computed by Postgres:
+    the application_stats RPC (migrations/002), or exact-count requests
+    if that hasn't been installed. No rows are transferred either way.
+    """
+    since_iso = since.astimezone(timezone.utc).isoformat()
+    try:
+        return await client.rpc("application_stats", since=since_iso)
+    except PostgrestError as e:
+        if e.status != 404:
+            raise
+
+    total, recent, *counts = await asyncio.gather(
+        client.count(TABLE),
+        client.count(TABLE, date=f"gt.{since_iso}"),
+        *(client.count(TABLE, status=f"eq.{status}") for status in STATUSES),
+    )
+    return {"total": total, "this_week": recent, "by_status": dict(zip(STATUSES, counts))}
+
+
+async def remote_since(client, since, limit=None, columns="company,role,status,date"):
+    """Only the rows dated after since, newest first, with only the columns shown."""
+    params = {
+        "select": columns,
+        "date": f"gt.{since.astimezone(timezone.utc).isoformat()}",
+        "order": "date.desc",
+    }
+    if limit:
+        params["limit"] = limit
+    return await client.select(TABLE, **params)
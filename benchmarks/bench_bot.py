@@ -0,0 +1,218 @@
+"""
+bench_bot.py
+Local harness comparing bot.py's polling and webhook modes.
+
+bot.py runs as a subprocess against a fake Bot API (BotApiStub), once per
+mode. Each run reports:
+
+  idle        — CPU time, Bot API requests and resident memory over
+                IDLE_SECONDS with no traffic
+  round trip  — time from a synthetic /help update entering Telegram's side
+                (queued for getUpdates, or POSTed to the webhook with the
+                secret token) to the bot's reply reaching the fake API
+  secret      — in webhook mode, that an update with the wrong secret
+                token is refused
+
+/help doesn't touch Supabase, so the timings are the serving path alone.
+CPU and memory are read from /proc and show as n/a elsewhere.
+
+Usage:
+  python benchmarks/bench_bot.py
+  python benchmarks/bench_bot.py webhook
+"""
+
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_server import BotApiStub
+from config import BOT_WEBHOOK_PATH
+
+BOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bot.py")
+MODES = ("polling", "webhook")
+COMMANDS = 20
+IDLE_SECONDS = 15     # Longer than one getUpdates long-poll
+START_TIMEOUT = 30
+REPLY_TIMEOUT = 10
+SECRET = "bench-secret"
+
+
+# ============================================================
+# PROCESS STATS
+# ============================================================
+
+def cpu_seconds(pid):
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except OSError:
+        return None
+
+
+def rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# ============================================================
+# UPDATES
+# ============================================================
+
+def help_update(update_id):
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": 1, "type": "private"},
+            "from": {"id": 1, "is_bot": False, "first_name": "Bench"},
+            "text": "/help",
+            "entities": [{"type": "bot_command", "offset": 0, "length": 5}],
+        },
+    }
+
+
+def post_update(url, update, secret):
+    request = urllib.request.Request(
+        url, data=json.dumps(update).encode(), method="POST",
+        headers={"Content-Type": "application/json",
+                 "X-Telegram-Bot-Api-Secret-Token": secret},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=REPLY_TIMEOUT) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+# ============================================================
+# ONE MODE
+# ============================================================
+
+def start_bot(stub, mode, workdir):
+    port = free_port()
+    env = dict(
+        os.environ,
+        BOT_MODE=mode,
+        TELEGRAM_API_URL=stub.url,
+        TELEGRAM_BOT_TOKEN="123456:bench",
+        WEBHOOK_URL=f"http://127.0.0.1:{port}",
+        WEBHOOK_SECRET=SECRET,
+        PORT=str(port),
+        SCHEDULER_ENABLED="false",
+    )
+    proc = subprocess.Popen([sys.executable, BOT], cwd=workdir, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    # Polling is up once it asks for updates; a webhook once it has
+    # registered itself and accepts connections
+    ready_call = "getUpdates" if mode == "polling" else "setWebhook"
+    if not stub.wait(lambda: stub.calls.get(ready_call), START_TIMEOUT):
+        proc.kill()
+        raise RuntimeError(f"bot.py didn't start in {mode} mode")
+    deadline = time.monotonic() + START_TIMEOUT
+    while mode == "webhook":
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                proc.kill()
+                raise RuntimeError("webhook never started listening")
+            time.sleep(0.05)
+    return proc, f"http://127.0.0.1:{port}/{BOT_WEBHOOK_PATH}"
+
+
+def run_mode(stub, mode, first_id):
+    with tempfile.TemporaryDirectory() as workdir:
+        proc, webhook = start_bot(stub, mode, workdir)
+        try:
+            time.sleep(1)   # Let startup settle before measuring idle
+            cpu_before, requests_before = cpu_seconds(proc.pid), stub.requests
+            time.sleep(IDLE_SECONDS)
+            cpu_after = cpu_seconds(proc.pid)
+            result = {
+                "idle_cpu_pct": (cpu_after - cpu_before) / IDLE_SECONDS * 100
+                                if cpu_before is not None else None,
+                "idle_requests_per_min": (stub.requests - requests_before) / IDLE_SECONDS * 60,
+                "rss_mb": rss_mb(proc.pid),
+            }
+
+            if mode == "webhook":
+                status = post_update(webhook, help_update(first_id), "wrong-" + SECRET)
+                result["bad_secret_status"] = status
+                first_id += 1
+
+            latencies = []
+            for update_id in range(first_id, first_id + COMMANDS):
+                seen = len(stub.replies)
+                start = time.perf_counter()
+                if mode == "polling":
+                    stub.push(help_update(update_id))
+                else:
+                    post_update(webhook, help_update(update_id), SECRET)
+                if not stub.wait(lambda: len(stub.replies) > seen, REPLY_TIMEOUT):
+                    raise RuntimeError(f"no reply to update {update_id} in {mode} mode")
+                latencies.append((stub.replies[seen][0] - start) * 1000)
+
+            latencies.sort()
+            result["round_trip_ms"] = statistics.median(latencies)
+            result["round_trip_p95_ms"] = latencies[int(len(latencies) * 0.95) - 1]
+            return result, first_id + COMMANDS
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def _fmt(value, spec):
+    return "n/a" if value is None else format(value, spec)
+
+
+def main():
+    modes = [m for m in sys.argv[1:] if m in MODES] or list(MODES)
+    update_id = 1
+    with BotApiStub() as stub:
+        for mode in modes:
+            result, update_id = run_mode(stub, mode, update_id)
+            print(f"[{mode}]")
+            print(f"  round trip   median {result['round_trip_ms']:.1f} ms, "
+                  f"p95 {result['round_trip_p95_ms']:.1f} ms over {COMMANDS} commands")
+            print(f"  idle         {_fmt(result['idle_cpu_pct'], '.2f')}% CPU, "
+                  f"{result['idle_requests_per_min']:.1f} Bot API requests/min, "
+                  f"{_fmt(result['rss_mb'], '.1f')} MB RSS")
+            if "bad_secret_status" in result:
+                print(f"  wrong secret HTTP {result['bad_secret_status']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+bench_parse.py
+Per-board HTML parser benchmark.
+
+Times each board's search page under the full html.parser tree, the full
+lxml tree, and lxml restricted to the board's listing containers, plus
+the full extract_listings() pass as currently configured.
+
+The fixtures are generated by make_fixtures.py; --record replaces them
+with live pages.
+
+Usage:
+  python benchmarks/bench_parse.py            # use pages in benchmarks/fixtures/
+  python benchmarks/bench_parse.py --record   # fetch live pages into fixtures first
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+import scraper
+import transport
+from boards import BOARDS, parser, extract_listings
+from config import PARSE_ONLY_LISTINGS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+ITERATIONS = 20
+SAMPLE_KEYWORD = "software engineer"
+SAMPLE_LOCATION = "United Arab Emirates"
+
+
+def fixture_path(name):
+    return os.path.join(FIXTURES_DIR, f"{name}.html")
+
+
+def sample_url(board):
+    return board.build_url(SAMPLE_KEYWORD, SAMPLE_LOCATION if board.per_location else None)
+
+
+def record():
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for board in BOARDS:
+        name, url = board.name.lower(), sample_url(board)
+        response = transport.get(url, headers=scraper.HEADERS, timeout=15)
+        if response.status_code != 200:
+            print(f"[{name}] Failed — {response.status_code}")
+            continue
+        with open(fixture_path(name), "w", encoding="utf-8") as f:
+            f.write(response.text)
+        print(f"[{name}] Recorded {len(response.content) // 1024} KB")
+
+
+def time_ms(fn, html):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(html)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def main():
+    if "--record" in sys.argv:
+        record()
+
+    modes = [
+        ("html.parser", lambda strainer: lambda html: BeautifulSoup(html, "html.parser")),
+        ("lxml", lambda strainer: lambda html: BeautifulSoup(html, "lxml")),
+        ("lxml+strainer", lambda strainer: lambda html: BeautifulSoup(html, "lxml", parse_only=strainer)),
+    ]
+
+    print(f"Parser: {parser()}, parse only listings: {PARSE_ONLY_LISTINGS}")
+    print(f"{'board':<12}{'KB':>6}" + "".join(f"{label:>16}" for label, _ in modes) + f"{'extract':>12}{'listings':>10}")
+
+    for board in BOARDS:
+        name, strainer = board.name.lower(), board.strainer
+        parse = lambda html: extract_listings(board, html)
+        path = fixture_path(name)
+        if not os.path.exists(path):
+            print(f"{name:<12}  no fixture — run with --record")
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        timings = [time_ms(make(strainer), html) for _, make in modes]
+        parse_ms = time_ms(parse, html)
+        listings = len(parse(html))
+        print(
+            f"{name:<12}{len(html.encode()) // 1024:>6}"
+            + "".join(f"{ms:>14.2f}ms" for ms in timings)
+            + f"{parse_ms:>10.2f}ms{listings:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
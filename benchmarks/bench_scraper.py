@@ -0,0 +1,219 @@
+"""
+bench_scraper.py
+Offline performance suite for the scraper.
+
+  parse       — extract_listings() time per search page, per board
+  scoring     — score_job() throughput over the fixture titles, on the
+                title alone and with a full job description
+  end-to-end  — scraper.main() wall time against a stub server per board
+                and a fake Telegram API: once on empty state (cold), once
+                on the state that run left (warm), and peak traced memory
+                of a cold run
+
+Nothing leaves the machine. Per-host politeness delays are turned off for
+the stub hosts so wall time measures the scraper rather than its sleeps;
+Telegram pacing is left as is. State files are written to a temp dir.
+
+Usage:
+  python benchmarks/bench_scraper.py
+  python benchmarks/bench_scraper.py --save before.json
+  python benchmarks/bench_scraper.py --compare before.json   # exit 1 on a regression
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_server import BoardStub, TelegramStub, load_fixture
+
+ITERATIONS = 20
+SCORE_SECONDS = 1.0
+REGRESSION_PCT = 25   # --compare fails when a metric is this much worse
+
+# Metric name -> True if higher is better
+METRICS = {
+    "score_titles_per_sec": True,
+    "score_described_per_sec": True,
+    "main_cold_sec": False,
+    "main_warm_sec": False,
+    "main_peak_mb": False,
+}
+
+
+# ============================================================
+# MICRO BENCHMARKS
+# ============================================================
+
+def bench_parse(boards, extract_listings):
+    results = {}
+    for board in boards:
+        html = load_fixture(board.name.lower()).decode()
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            listings = extract_listings(board, html)
+        results[board.name] = {
+            "ms": (time.perf_counter() - start) / ITERATIONS * 1000,
+            "kb": len(html.encode()) // 1024,
+            "listings": len(listings),
+        }
+    return results
+
+
+def throughput(fn, items):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < SCORE_SECONDS:
+        for item in items:
+            fn(*item)
+        count += len(items)
+    return count / (time.perf_counter() - start)
+
+
+def bench_scoring(boards, extract_listings, extract_description, score_job):
+    titles = []
+    description = ""
+    for board in boards:
+        name = board.name.lower()
+        titles += [l["title"] for l in extract_listings(board, load_fixture(name).decode())]
+        description = description or extract_description(
+            board, load_fixture(f"{name}_job").decode(), 20000
+        )
+    return {
+        "score_titles_per_sec": throughput(score_job, [(t,) for t in titles]),
+        "score_described_per_sec": throughput(score_job, [(t, description) for t in titles]),
+    }
+
+
+# ============================================================
+# END-TO-END
+# ============================================================
+
+def run_main(scraper, traced=False):
+    """One scraper.main() with its output captured. Returns (seconds, peak MB)."""
+    if traced:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper.main()
+    elapsed = time.perf_counter() - start
+    peak = 0.0
+    if traced:
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_end_to_end(telegram):
+    import boards
+    import transport
+    from config import FETCH_HOST_CONCURRENCY
+
+    stubs = [BoardStub(board) for board in boards.BOARDS]
+    with contextlib.ExitStack() as stack:
+        for board, stub in zip(boards.BOARDS, stubs):
+            stack.enter_context(stub)
+            stub.point(board)
+            transport.LIMITER.limits[board.host] = (FETCH_HOST_CONCURRENCY, 0.0)
+        transport.LIMITER.limits[transport.host_of(telegram.url)] = (FETCH_HOST_CONCURRENCY, 0.0)
+
+        import scraper
+
+        with tempfile.TemporaryDirectory() as cold_dir, tempfile.TemporaryDirectory() as traced_dir:
+            cwd = os.getcwd()
+            try:
+                os.chdir(cold_dir)
+                cold, _ = run_main(scraper)
+                sent_cold = len(telegram.messages)
+                warm, _ = run_main(scraper)
+
+                os.chdir(traced_dir)
+                scraper.CACHE.close()
+                _, peak = run_main(scraper, traced=True)
+                scraper.CACHE.close()
+            finally:
+                os.chdir(cwd)
+
+    return {
+        "main_cold_sec": cold,
+        "main_warm_sec": warm,
+        "main_peak_mb": peak,
+        "requests": sum(stub.requests for stub in stubs),
+        "messages_cold": sent_cold,
+    }
+
+
+# ============================================================
+# REPORTING
+# ============================================================
+
+def compare(results, baseline):
+    """Print each metric against the baseline. Returns True if any regressed."""
+    regressed = False
+    print(f"\nAgainst baseline (fails at {REGRESSION_PCT}% worse):")
+    pairs = list(METRICS.items())
+    pairs += [(f"parse_ms.{name}", False) for name in results["parse_ms"]]
+    for name, higher_is_better in pairs:
+        section, _, key = name.partition(".")
+        now = results[section][key] if key else results[name]
+        before = (baseline.get(section) or {}).get(key) if key else baseline.get(name)
+        if not before:
+            continue
+        change = (now - before) / before * 100
+        worse = -change if higher_is_better else change
+        flag = "REGRESSION" if worse > REGRESSION_PCT else ""
+        regressed |= bool(flag)
+        print(f"  {name:<28}{before:>12.3f}{now:>12.3f}{change:>+9.1f}%  {flag}")
+    return regressed
+
+
+def main():
+    telegram = TelegramStub().__enter__()
+    os.environ["TELEGRAM_API_URL"] = telegram.url
+    os.environ["TELEGRAM_BOT_TOKEN"] = "bench"
+    os.environ["TELEGRAM_CHAT_ID"] = "1"
+
+    from boards import BOARDS, parser, extract_listings, extract_description
+    from scraper import score_job
+
+    parse = bench_parse(BOARDS, extract_listings)
+    print(f"Parser: {parser()}")
+    print(f"{'board':<12}{'KB':>6}{'parse':>12}{'listings':>10}")
+    for name, r in parse.items():
+        print(f"{name.lower():<12}{r['kb']:>6}{r['ms']:>10.2f}ms{r['listings']:>10}")
+
+    scoring = bench_scoring(BOARDS, extract_listings, extract_description, score_job)
+    print(f"\nscore_job: {scoring['score_titles_per_sec']:,.0f} titles/s, "
+          f"{scoring['score_described_per_sec']:,.0f} titles+descriptions/s")
+
+    e2e = bench_end_to_end(telegram)
+    telegram.__exit__(None, None, None)
+    print(
+        f"\nscraper.main: cold {e2e['main_cold_sec']:.2f}s, warm {e2e['main_warm_sec']:.2f}s, "
+        f"peak {e2e['main_peak_mb']:.1f} MB "
+        f"({e2e['requests']} stub requests, {e2e['messages_cold']} Telegram messages on the cold run)"
+    )
+
+    results = {"parse_ms": {name: r["ms"] for name, r in parse.items()}, **scoring, **e2e}
+
+    if "--save" in sys.argv:
+        path = sys.argv[sys.argv.index("--save") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved to {path}")
+
+    if "--compare" in sys.argv:
+        with open(sys.argv[sys.argv.index("--compare") + 1], "r", encoding="utf-8") as f:
+            if compare(results, json.load(f)):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+bench_startup.py
+Cold-start cost of the scheduled scripts.
+
+For each script, in fresh interpreters:
+
+  import      — time to import the module, and its heaviest top-level
+                imports (from python -X importtime)
+  first req   — wall time from launching `python <script>.py` to its first
+                network call (DNS lookup or connect), which is where the
+                script stops doing local setup
+
+The first network call is caught with an audit hook that ends the process
+there, so nothing is sent and no state is written; each run works in a
+temp dir. Times are medians over RUNS launches, next to an empty
+interpreter's for reference.
+
+Usage:
+  python benchmarks/bench_startup.py
+  python benchmarks/bench_startup.py daily_question
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = ("scraper", "daily_question", "weekly_summary")
+RUNS = 5
+TOP_IMPORTS = 5
+
+# Runs the script as __main__ until its first network call, then exits 0
+_FIRST_REQUEST = """
+import os, sys
+def hook(event, args):
+    if event in ("socket.getaddrinfo", "socket.connect"):
+        os._exit(0)
+sys.addaudithook(hook)
+sys.path.insert(0, {root!r})
+sys.argv = [{path!r}]
+import runpy
+runpy.run_path({path!r}, run_name="__main__")
+os._exit(3)
+"""
+
+_IMPORT = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+ENV = dict(
+    os.environ,
+    TELEGRAM_BOT_TOKEN="123456:bench",
+    TELEGRAM_CHAT_ID="1",
+    SUPABASE_KEY="bench",
+)
+
+
+def _run(code, workdir, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], cwd=workdir, env=ENV,
+        capture_output=True, text=True, timeout=120,
+    )
+
+
+def time_to_first_request(script, workdir):
+    code = _FIRST_REQUEST.format(root=ROOT, path=os.path.join(ROOT, f"{script}.py"))
+    start = time.perf_counter()
+    result = _run(code, workdir)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{script} exited {result.returncode} before any request:\n{result.stderr[-2000:]}")
+    return elapsed
+
+
+def import_time(module, workdir):
+    return float(_run(_IMPORT.format(root=ROOT, module=module), workdir).stdout)
+
+
+def heaviest_imports(module, workdir):
+    """(cumulative µs, name) of the imports made directly by module."""
+    stderr = _run(f"import sys; sys.path.insert(0, {ROOT!r}); import {module}",
+                  workdir, "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Depth shows as two spaces per level; level 1 = imported by module itself
+        if name.startswith("   ") and not name.startswith("     "):
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:TOP_IMPORTS]
+
+
+def baseline(workdir):
+    start = time.perf_counter()
+    _run("pass", workdir)
+    return time.perf_counter() - start
+
+
+def main():
+    scripts = [s for s in sys.argv[1:] if s in SCRIPTS] or list(SCRIPTS)
+    with tempfile.TemporaryDirectory() as workdir:
+        empty = statistics.median(baseline(workdir) for _ in range(RUNS))
+        print(f"Empty interpreter: {empty * 1000:.0f} ms\n")
+        print(f"{'script':<16}{'import':>10}{'first req':>12}")
+        details = {}
+        for script in scripts:
+            imported = statistics.median(import_time(script, workdir) for _ in range(RUNS))
+            first = statistics.median(time_to_first_request(script, workdir) for _ in range(RUNS))
+            details[script] = heaviest_imports(script, workdir)
+            print(f"{script:<16}{imported * 1000:>8.0f}ms{first * 1000:>10.0f}ms")
+
+    print("\nHeaviest imports (cumulative):")
+    for script, rows in details.items():
+        print(f"  {script}: " + ", ".join(f"{name} {us / 1000:.0f}ms" for us, name in rows))
+
+
+if __name__ == "__main__":
+    main()
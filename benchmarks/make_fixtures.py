@@ -0,0 +1,214 @@
+"""
+make_fixtures.py
+Builds the offline HTML fixtures the benchmarks run against.
+
+Each board gets a search results page (<board>.html) and a job page
+(<board>_job.html) laid out like the live site: the listing markup its
+Board spec selects, wrapped in the page chrome (inline scripts, styles,
+navigation, footer) that the parser has to get through on a real page.
+Titles and companies are drawn from a seeded generator, with some overlap
+across boards so deduplication has work to do. Output is deterministic,
+so timings stay comparable between checkouts.
+
+Links are relative, so they resolve against whatever base URL the board
+is pointed at; the benchmark stub server serves them.
+
+Usage:
+  python benchmarks/make_fixtures.py
+"""
+
+import html
+import json
+import os
+import random
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+LISTINGS_PER_PAGE = {"linkedin": 25, "bayt": 20, "gulftalent": 30, "dubizzle": 24, "wuzzuf": 15}
+
+TITLES = [
+    "Junior Full Stack Developer", "Full Stack Engineer (React/Node.js)", "Software Engineer",
+    "Graduate Software Engineer", "Junior React Developer", "Frontend Developer - Next.js",
+    "Backend Developer (Python)", "Node.js Developer", "Software Engineer - TypeScript",
+    "Entry Level Web Developer", "Trainee Software Developer", "React Native Developer",
+    "Python Developer", "Full Stack JavaScript Developer", "Software Developer",
+    "Senior Software Engineer", "Lead Backend Engineer", "Engineering Manager",
+    "Principal Architect", "Senior Frontend Developer", "DevOps Engineer",
+    "Sales Executive", "Accounting Manager", "PHP Laravel Developer",
+    "SAP Consultant", "Embedded C++ Engineer", "Marketing Specialist",
+]
+COMPANIES = [
+    "Noon", "Careem", "Talabat", "Emirates NBD", "Property Finder", "Kitopi",
+    "Tabby", "Tamara", "Bayzat", "Anghami", "Majid Al Futtaim", "e& (Etisalat)",
+    "G42", "Presight AI", "Dubizzle Group", "Yango", "Deliveroo", "Fetchr",
+    "Sarwa", "Huspy", "Baraka", "Zywa", "Rain", "Ziina",
+]
+CITIES = ["Dubai", "Abu Dhabi", "Sharjah", "Muscat", "Doha", "Riyadh"]
+
+DESCRIPTION = (
+    "We are looking for a motivated developer to join our product engineering team. "
+    "You will build features end to end across our React and Next.js web apps and our "
+    "Node.js and Python services, working closely with design and product. "
+    "Requirements: 0-2 years of experience with JavaScript or TypeScript, familiarity "
+    "with REST APIs, PostgreSQL and Git, and a degree in Computer Science or equivalent. "
+    "Nice to have: Prisma, Tailwind CSS, Socket.io, experience with cloud deployments. "
+    "We offer a competitive salary, visa, medical insurance and annual flights. "
+)
+
+
+# ============================================================
+# PAGE CHROME
+# ============================================================
+
+def _chrome_head(rng, title):
+    state = {
+        "experiments": {f"exp_{i}": rng.choice(["control", "variant"]) for i in range(150)},
+        "i18n": {f"key_{i}": "Lorem ipsum dolor sit amet " * 2 for i in range(250)},
+    }
+    css = "\n".join(
+        f".c{i}{{margin:{i % 8}px;padding:{i % 5}px;color:#{rng.randrange(0xFFFFFF):06x}}}"
+        for i in range(400)
+    )
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)}</title>"
+        "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">"
+        f"<style>{css}</style>"
+        f"<script>window.__STATE__ = {json.dumps(state)};</script>"
+        "<script src=\"/static/app.js\" defer></script></head><body>"
+    )
+
+
+def _chrome_nav():
+    links = "".join(
+        f'<li class="nav-item"><a class="nav-link" href="/browse/{i}">Category {i}</a></li>'
+        for i in range(60)
+    )
+    return f'<header class="site-header"><nav class="main-nav"><ul>{links}</ul></nav></header>'
+
+
+def _chrome_footer():
+    cols = "".join(
+        f'<div class="footer-col"><h5>Section {i}</h5><ul>'
+        + "".join(f'<li><a href="/footer/{i}/{j}">Link {j}</a></li>' for j in range(12))
+        + "</ul></div>"
+        for i in range(8)
+    )
+    return f'<footer class="site-footer">{cols}</footer></body></html>'
+
+
+def _page(rng, title, main):
+    return _chrome_head(rng, title) + _chrome_nav() + f"<main>{main}</main>" + _chrome_footer()
+
+
+# ============================================================
+# BOARD LISTING MARKUP
+# ============================================================
+
+def _linkedin(i, title, company, city):
+    return (
+        f'<li><div class="base-card relative w-full hover:no-underline focus:no-underline '
+        f'base-card--link base-search-card base-search-card--link job-search-card" '
+        f'data-entity-urn="urn:li:jobPosting:{4000000000 + i}">'
+        f'<a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" '
+        f'href="/jobs/view/{4000000000 + i}?refId=abc{i}&amp;trackingId=xyz{i}">'
+        f'<span class="sr-only">{title}</span></a>'
+        f'<div class="search-entity-media"><img class="artdeco-entity-image" alt="{company}" '
+        f'data-delayed-url="/logo/{i}.png"></div>'
+        f'<div class="base-search-card__info"><h3 class="base-search-card__title">{title}</h3>'
+        f'<h4 class="base-search-card__subtitle"><a class="hidden-nested-link" '
+        f'href="/company/{i}">{company}</a></h4>'
+        f'<div class="base-search-card__metadata">'
+        f'<span class="job-search-card__location">{city}, United Arab Emirates</span>'
+        f'<time class="job-search-card__listdate" datetime="2026-10-17">1 day ago</time>'
+        f'</div></div></div></li>'
+    )
+
+
+def _bayt(i, title, company, city):
+    return (
+        f'<li class="has-pointer-d" data-js-job="" data-job-id="{5000000 + i}">'
+        f'<div class="row no-wrap"><div class="col u-stretch">'
+        f'<h2 class="m0 t-regular"><a href="/en/uae/jobs/{5000000 + i}/" data-js-aid="jobID">'
+        f'{title}</a></h2>'
+        f'<div class="job-company-location-wrapper"><b class="t-default">{company}</b> '
+        f'<span class="t-mute">{city} &middot; UAE</span></div></div></div>'
+        f'<div class="jb-descr m10t t-small">{DESCRIPTION[:160]}</div></li>'
+    )
+
+
+def _gulftalent(i, title, company, city):
+    return (
+        f'<div class="job-item panel panel-default"><div class="panel-body">'
+        f'<a href="/uae/jobs/{title.lower().replace(" ", "-")}-{300000 + i}"><h3>{title}</h3></a>'
+        f'<span class="company">{company}</span> <span class="location">{city}</span>'
+        f'<span class="date text-muted">17 Oct</span></div></div>'
+    )
+
+
+def _dubizzle(i, title, company, city):
+    return (
+        f'<article class="listing-card" data-testid="listing-{i}">'
+        f'<a href="/jobs/it-software/{700000 + i}/"><h2>{title}</h2></a>'
+        f'<span class="listing-company-name">{company}</span>'
+        f'<span class="listing-location">{city}</span>'
+        f'<span class="listing-salary">AED {8000 + (i * 1237) % 14000}</span></article>'
+    )
+
+
+def _wuzzuf(i, title, company, city):
+    return (
+        f'<div class="css-1gatmva e1v1l3u10"><div class="css-pkv5jc">'
+        f'<h2 class="css-m604qf"><a class="css-o171kl" rel="noreferrer" '
+        f'href="/jobs/p/{i}abc-{title.lower().replace(" ", "-")}">{title}</a></h2>'
+        f'<div class="css-d7j1kk"><a class="css-17s97q8" href="/jobs/careers/{i}">{company} -</a>'
+        f'<span class="css-5wys0k">{city}, UAE</span></div></div></div>'
+    )
+
+
+BUILDERS = {
+    "linkedin": (_linkedin, '<ul class="jobs-search__results-list">{}</ul>'),
+    "bayt": (_bayt, '<ul class="list-unstyled" id="results_inner_card">{}</ul>'),
+    "gulftalent": (_gulftalent, '<div class="search-results">{}</div>'),
+    "dubizzle": (_dubizzle, '<section class="listings">{}</section>'),
+    "wuzzuf": (_wuzzuf, '<div class="css-9i2afk">{}</div>'),
+}
+
+DESCRIPTION_BLOCKS = {
+    "linkedin": '<div class="show-more-less-html__markup relative overflow-hidden">{}</div>',
+    "bayt": '<div class="card-content is-spaced t-break">{}</div>',
+    "gulftalent": '<div class="job-description">{}</div>',
+    "dubizzle": '<div class="listing-description">{}</div>',
+    "wuzzuf": '<div class="css-1t5f0fr">{}</div>',
+}
+
+
+def search_page(board):
+    rng = random.Random(f"search-{board}")
+    listing, wrapper = BUILDERS[board]
+    items = []
+    for i in range(LISTINGS_PER_PAGE[board]):
+        title = html.escape(rng.choice(TITLES))
+        company = html.escape(rng.choice(COMPANIES))
+        items.append(listing(i, title, company, rng.choice(CITIES)))
+    return _page(rng, f"{board} job search", wrapper.format("".join(items)))
+
+
+def job_page(board):
+    rng = random.Random(f"job-{board}")
+    paragraphs = "".join(f"<p>{DESCRIPTION}</p>" for _ in range(6))
+    return _page(rng, f"{board} job", DESCRIPTION_BLOCKS[board].format(paragraphs))
+
+
+def main():
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for board in BUILDERS:
+        for name, page in ((board, search_page(board)), (f"{board}_job", job_page(board))):
+            path = os.path.join(FIXTURES_DIR, f"{name}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(page)
+            print(f"[{name}] {len(page.encode()) // 1024} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+stub_server.py
+Local stand-ins for the job boards and the Telegram Bot API.
+
+BoardStub serves one board's recorded job page for the links listed on
+its recorded search page, and the search page for anything else, with an
+ETag so the scraper's conditional GETs get 304s on a repeat run.
+TelegramStub accepts sendMessage calls and counts them. BotApiStub is
+enough of the Bot API for bot.py: it hands out queued updates to
+long-polling getUpdates calls and records the bot's replies. Each stub
+listens on its own 127.0.0.1 port, so the scraper still sees one host per
+board.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from boards import extract_listings
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, f"{name}.html"), "rb") as f:
+        return f.read()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like the real sites
+
+    def _reply(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass   # Client went away, e.g. a long poll cut short by shutdown
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Stub:
+    def __init__(self, handler):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        self.server.stub = self
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.requests = 0
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _BoardHandler(_Handler):
+    def do_GET(self):
+        stub = self.server.stub
+        stub.requests += 1
+        page = stub.job if urlsplit(self.path).path in stub.job_paths else stub.search
+        if self.headers.get("If-None-Match") == page[1]:
+            self._reply(304, headers={"ETag": page[1]})
+        else:
+            self._reply(200, page[0], headers={"ETag": page[1]})
+
+
+class BoardStub(_Stub):
+    """Serves a board's fixtures; point() rewrites the board's URLs at it."""
+
+    def __init__(self, board):
+        super().__init__(_BoardHandler)
+        name = board.name.lower()
+        self.search = self._with_etag(load_fixture(name))
+        self.job = self._with_etag(load_fixture(f"{name}_job"))
+        self.job_paths = {
+            urlsplit(listing["url"]).path
+            for listing in extract_listings(board, self.search[0].decode())
+        }
+
+    @staticmethod
+    def _with_etag(body):
+        return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+    def point(self, board):
+        parts = urlsplit(board.search_url)
+        board.base_url = self.url
+        board.host = urlsplit(self.url).netloc
+        board.search_url = self.url + board.search_url[len(f"{parts.scheme}://{parts.netloc}"):]
+
+
+class _TelegramHandler(_Handler):
+    def do_POST(self):
+        stub = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        stub.requests += 1
+        if self.path.endswith("/sendMessage"):
+            stub.messages.append(json.loads(body or b"{}"))
+            self._reply(200, b'{"ok":true,"result":{}}', "application/json")
+        else:
+            self._reply(404, b'{"ok":false}', "application/json")
+
+
+class TelegramStub(_Stub):
+    """Fake Bot API; set TELEGRAM_API_URL to .url before telegram_sender is imported."""
+
+    def __init__(self):
+        super().__init__(_TelegramHandler)
+        self.messages = []
+
+
+class _BotApiHandler(_Handler):
+    def _params(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return json.loads(body or b"{}")
+        # python-telegram-bot form-encodes parameters, each one JSON-encoded
+        params = {}
+        for key, value in parse_qsl(body.decode()):
+            try:
+                params[key] = json.loads(value)
+            except ValueError:
+                params[key] = value
+        return params
+
+    def do_POST(self):
+        stub = self.server.stub
+        method = self.path.rsplit("/", 1)[-1]
+        params = self._params()
+        with stub.changed:
+            stub.requests += 1
+            stub.calls[method] = stub.calls.get(method, 0) + 1
+            stub.changed.notify_all()
+        result = getattr(stub, f"_{method}", lambda params: True)(params)
+        self._reply(200, json.dumps({"ok": True, "result": result}).encode(), "application/json")
+
+    do_GET = do_POST
+
+
+class BotApiStub(_Stub):
+    """Fake Bot API for bot.py; point TELEGRAM_API_URL at .url."""
+
+    def __init__(self):
+        super().__init__(_BotApiHandler)
+        self.changed = threading.Condition()
+        self.updates = []
+        self.replies = []    # (time.perf_counter(), text)
+        self.calls = {}
+
+    def push(self, update):
+        """Queue an update for the next getUpdates."""
+        with self.changed:
+            self.updates.append(update)
+            self.changed.notify_all()
+
+    def wait(self, predicate, timeout):
+        """Block until predicate() holds; returns its last value."""
+        with self.changed:
+            return self.changed.wait_for(predicate, timeout)
+
+    def _getMe(self, params):
+        return {"id": 1, "is_bot": True, "first_name": "Bench", "username": "bench_bot"}
+
+    def _getUpdates(self, params):
+        offset = int(params.get("offset") or 0)
+        with self.changed:
+            self.changed.wait_for(
+                lambda: any(u["update_id"] >= offset for u in self.updates),
+                float(params.get("timeout") or 0),
+            )
+            return [u for u in self.updates if u["update_id"] >= offset]
+
+    def _sendMessage(self, params):
+        with self.changed:
+            self.replies.append((time.perf_counter(), params.get("text", "")))
+            self.changed.notify_all()
+        return {
+            "message_id": len(self.replies), "date": int(time.time()),
+            "chat": {"id": int(params["chat_id"]), "type": "private"},
+            "text": params.get("text", ""),
+        }
@@ -0,0 +1,261 @@
+"""
+boards.py
+Job board adapters and the extraction engine that runs them.
+
+Each board is described as data — search URL template, listing container,
+CSS selectors for each field and the base URL links are resolved against —
+and every board goes through the same parse and link-normalization code.
+Adding a board means adding a Board(...) entry to BOARDS.
+
+Selectors are compiled once, on a board's first parse. bs4 and soupsieve
+are only imported then, so importing this module stays cheap.
+"""
+
+import re
+from functools import cache, cached_property
+from urllib.parse import urljoin
+
+from config import HTML_PARSER, PARSE_ONLY_LISTINGS, MAX_LISTINGS_PER_PAGE
+
+
+@cache
+def parser():
+    """HTML_PARSER if it is installed, else html.parser."""
+    from bs4.builder import builder_registry
+    return HTML_PARSER if builder_registry.lookup(HTML_PARSER) else "html.parser"
+
+
+def has_class(name):
+    # Strainers see the raw class attribute before it is split into a list
+    return re.compile(rf"(?:^|\s){re.escape(name)}(?:\s|$)")
+
+
+def _compile_container(container):
+    """SoupStrainer and compiled selector for a (tag, class) pair."""
+    import soupsieve
+    from bs4 import SoupStrainer
+
+    tag, css_class = container
+    strainer = SoupStrainer(tag, {"class": has_class(css_class)} if css_class else {})
+    return strainer, soupsieve.compile(f"{tag}.{css_class}" if css_class else tag)
+
+
+class Board:
+    """
+    Adapter spec for one job board.
+
+    search_url   — template with {query} and {location} placeholders
+    space        — what spaces in the keyword/location become in the URL
+    container    — (tag, class) of one listing; class may be None
+    fields       — field name -> CSS selector, or a tuple of selectors tried
+                   in order; "link" must select the element holding the href
+    description  — (tag, class) of the description block on a job's own
+                   page, or None if the board isn't enriched
+    page_param   — appended to search_url for pages after the first; may use
+                   {page} (1-based), {index} (0-based) or {offset}
+                   (index × page_size). None means one page only.
+    """
+
+    def __init__(self, name, host, base_url, search_url, container, fields,
+                 space="%20", lowercase=False, per_location=False,
+                 default_location="UAE", strip_query=False, description=None,
+                 page_param=None, page_size=25):
+        self.name = name
+        self.host = host
+        self.base_url = base_url
+        self.search_url = search_url
+        self.space = space
+        self.lowercase = lowercase
+        self.per_location = per_location
+        self.default_location = default_location
+        self.strip_query = strip_query
+        self.page_param = page_param
+        self.page_size = page_size
+        self.has_description = description is not None
+        self._specs = (container, description, fields)
+
+    @cached_property
+    def _selectors(self):
+        import soupsieve
+
+        container, description, fields = self._specs
+        return (
+            _compile_container(container),
+            _compile_container(description) if description else (None, None),
+            {
+                field: tuple(soupsieve.compile(s) for s in (
+                    selectors if isinstance(selectors, tuple) else (selectors,)
+                ))
+                for field, selectors in fields.items()
+            },
+        )
+
+    @property
+    def strainer(self):
+        return self._selectors[0][0]
+
+    @property
+    def container(self):
+        return self._selectors[0][1]
+
+    @property
+    def description_strainer(self):
+        return self._selectors[1][0]
+
+    @property
+    def description(self):
+        return self._selectors[1][1]
+
+    @property
+    def fields(self):
+        return self._selectors[2]
+
+    def build_url(self, keyword, location=None, page=1):
+        query = keyword.strip()
+        if self.lowercase:
+            query = query.lower()
+        url = self.search_url.format(
+            query=query.replace(" ", self.space),
+            location=(location or "").replace(" ", self.space),
+        )
+        if page > 1 and self.page_param:
+            index = page - 1
+            url += self.page_param.format(page=page, index=index, offset=index * self.page_size)
+        return url
+
+    def normalize_link(self, href):
+        link = urljoin(self.base_url, href.strip())
+        return link.split("?")[0] if self.strip_query else link
+
+
+BOARDS = [
+    Board(
+        "LinkedIn", "www.linkedin.com", "https://www.linkedin.com",
+        # No entry-level filter (f_E) — catches more junior roles
+        "https://www.linkedin.com/jobs/search/?keywords={query}&location={location}&f_TPR=r86400",
+        container=("div", "base-card"),
+        fields={
+            "title": "h3.base-search-card__title",
+            "company": "h4.base-search-card__subtitle",
+            "location": "span.job-search-card__location",
+            "link": "a.base-card__full-link[href]",
+        },
+        per_location=True,
+        strip_query=True,
+        description=("div", "show-more-less-html__markup"),
+        page_param="&start={offset}",
+    ),
+    Board(
+        "Bayt", "www.bayt.com", "https://www.bayt.com",
+        "https://www.bayt.com/en/uae/jobs/{query}-jobs/",
+        container=("li", "has-pointer-d"),
+        fields={
+            "title": "h2.m0.t-regular",
+            "company": "b.t-default",
+            "location": "span.t-mute",
+            "link": "a[href]",
+        },
+        space="-",
+        lowercase=True,
+        description=("div", "t-break"),
+        page_param="?page={page}",
+    ),
+    Board(
+        "GulfTalent", "www.gulftalent.com", "https://www.gulftalent.com",
+        "https://www.gulftalent.com/uae/jobs/search/?search_text={query}",
+        container=("div", "job-item"),
+        fields={
+            "title": "h3",
+            "company": "span.company",
+            "location": "span.location",
+            "link": "a[href]",
+        },
+        space="+",
+        description=("div", "job-description"),
+        page_param="&page={page}",
+    ),
+    Board(
+        "Dubizzle", "uae.dubizzle.com", "https://uae.dubizzle.com",
+        "https://uae.dubizzle.com/jobs/?search={query}",
+        container=("article", None),
+        fields={
+            "title": ("h2", "h3"),
+            "company": 'span[class*="company" i]',
+            "location": 'span[class*="location" i]',
+            "link": "a[href]",
+        },
+        page_param="&page={page}",
+    ),
+    Board(
+        "Wuzzuf", "wuzzuf.net", "https://wuzzuf.net",
+        "https://wuzzuf.net/search/jobs/?q={query}&a=hpb",
+        container=("div", "css-1gatmva"),
+        fields={
+            "title": "h2.css-m604qf",
+            "company": "a.css-17s97q8",
+            "location": "span.css-5wys0k",
+            "link": "h2.css-m604qf a[href]",
+        },
+        space="+",
+        page_param="&start={index}",
+    ),
+]
+
+BOARDS_BY_NAME = {board.name: board for board in BOARDS}
+
+
+# ============================================================
+# EXTRACTION ENGINE
+# ============================================================
+
+def make_soup(html, strainer):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, parser(), parse_only=strainer if PARSE_ONLY_LISTINGS else None)
+
+
+def _select(listing, selectors):
+    for selector in selectors:
+        tag = selector.select_one(listing)
+        if tag is not None:
+            return tag
+    return None
+
+
+def extract_listings(board, html, location=None, limit=MAX_LISTINGS_PER_PAGE):
+    """Raw listings (title, company, location, url) from one search page."""
+    results = []
+    soup = make_soup(html, board.strainer)
+    fields = board.fields
+
+    for listing in board.container.select(soup, limit=limit):
+        try:
+            title_tag = _select(listing, fields["title"])
+            link_tag = _select(listing, fields["link"])
+            if not title_tag or not link_tag or not link_tag.get("href"):
+                continue
+
+            company_tag = _select(listing, fields["company"])
+            location_tag = _select(listing, fields["location"])
+            results.append({
+                "title": title_tag.get_text(strip=True),
+                "company": company_tag.get_text(strip=True) if company_tag else "Unknown",
+                "location": (
+                    location_tag.get_text(strip=True) if location_tag
+                    else location or board.default_location
+                ),
+                "url": board.normalize_link(link_tag["href"]),
+            })
+
+        except Exception:
+            continue
+
+    return results
+
+
+def extract_description(board, html, max_chars):
+    """Plain text of a job page's description block, or "" if it isn't found."""
+    if not board.has_description:
+        return ""
+    soup = make_soup(html, board.description_strainer)
+    block = board.description.select_one(soup)
+    return block.get_text(" ", strip=True)[:max_chars] if block else ""
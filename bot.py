@@ -1,7 +1,11 @@
 """
 bot.py
 Interactive Telegram bot for tracking job applications.
-Deploy to Render as a background worker — runs 24/7.
+Deploy to Render — runs 24/7, either as a background worker that
+long-polls Telegram (BOT_MODE=polling) or as a web service that Telegram
+pushes updates to (BOT_MODE=webhook, with WEBHOOK_URL and WEBHOOK_SECRET).
+Unless SCHEDULER_ENABLED is off it also runs the job scraper, the daily
+question and the weekly summary on their schedules (scheduler.py).
 
 Commands:
   /applied <company> <role>  — Log a new application
@@ -10,32 +14,52 @@ Commands:
   /offer <company>           — Mark as offer received
   /stats                     — Show all-time stats
   /list                      — Show this week's applications
+  /import                    — Add applications from a CSV/JSON document
+  /export [csv|json]         — Download every application
   /help                      — Show all commands
 """
 
+import asyncio
+import html
 import os
 import logging
-import requests
+import tempfile
 from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
+from env import load_env
 from telegram import Update
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
+
+load_env()
+
+import application_io
+from applications_store import ApplicationsReplica
+from supabase_client import PostgrestClient, PostgrestError
+from config import (
+    TELEGRAM_BOT_TOKEN as _CONFIG_TOKEN,
+    TELEGRAM_API_URL as _CONFIG_API_URL,
+    BOT_MODE as _CONFIG_MODE,
+    BOT_WEBHOOK_LISTEN, BOT_WEBHOOK_PORT, BOT_WEBHOOK_PATH,
+    IMPORT_MAX_BYTES,
+    SCHEDULER_ENABLED as _CONFIG_SCHEDULER,
+)
+TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", _CONFIG_TOKEN)
+TELEGRAM_API_URL = os.environ.get("TELEGRAM_API_URL", _CONFIG_API_URL)
 
-load_dotenv()
+# --- Serving mode ---
+BOT_MODE = os.environ.get("BOT_MODE", _CONFIG_MODE)
+WEBHOOK_URL = os.environ.get("WEBHOOK_URL", "")
+WEBHOOK_SECRET = os.environ.get("WEBHOOK_SECRET", "")
+WEBHOOK_PORT = int(os.environ.get("PORT", BOT_WEBHOOK_PORT))
 
-from config import TELEGRAM_BOT_TOKEN as _CONFIG_TOKEN
-TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", _CONFIG_TOKEN)
+# --- Scheduled jobs ---
+SCHEDULER_ENABLED = os.environ.get("SCHEDULER_ENABLED", str(_CONFIG_SCHEDULER)).lower() in ("1", "true", "yes")
 
 # --- Supabase Config ---
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://gmxjjqpoehbsjtqgbdot.supabase.co")
 SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "")
 
-SUPABASE_HEADERS = {
-    "apikey": SUPABASE_KEY,
-    "Authorization": f"Bearer {SUPABASE_KEY}",
-    "Content-Type": "application/json",
-    "Prefer": "return=representation",
-}
+DB = PostgrestClient(SUPABASE_URL, SUPABASE_KEY)
+APPLICATIONS = ApplicationsReplica(DB)
 
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -47,43 +71,42 @@ logging.basicConfig(
 # SUPABASE HELPERS
 # ============================================================
 
-def db_insert(data: dict):
-    response = requests.post(
-        f"{SUPABASE_URL}/rest/v1/applications",
-        headers=SUPABASE_HEADERS,
-        json=data,
-        timeout=10
-    )
-    return response.json()
+async def db_insert(data: dict):
+    return await APPLICATIONS.insert(data)
 
 
-def db_get_all():
-    response = requests.get(
-        f"{SUPABASE_URL}/rest/v1/applications?order=date.desc",
-        headers=SUPABASE_HEADERS,
-        timeout=10
-    )
-    return response.json()
+async def db_update(app_id: int, data: dict):
+    return await APPLICATIONS.update(app_id, data)
 
 
-def db_update(app_id: int, data: dict):
-    response = requests.patch(
-        f"{SUPABASE_URL}/rest/v1/applications?id=eq.{app_id}",
-        headers=SUPABASE_HEADERS,
-        json=data,
-        timeout=10
-    )
-    return response.json()
+async def db_delete(app_id: int):
+    return await APPLICATIONS.delete(app_id)
 
 
-def find_application(company: str):
-    response = requests.get(
-        f"{SUPABASE_URL}/rest/v1/applications?company=ilike.*{company}*&order=date.desc&limit=1",
-        headers=SUPABASE_HEADERS,
-        timeout=10
+async def find_application(update: Update, company: str, not_found: str):
+    """
+    The application company refers to, or None after replying: not_found if
+    nothing matches, the ranked candidates if the match is ambiguous. Nothing
+    is changed on a guess.
+    """
+    app, candidates = await APPLICATIONS.find(company)
+    if app:
+        return app
+    if not candidates:
+        await update.message.reply_text(not_found, parse_mode="HTML")
+        return None
+    lines = [
+        f"• {html.escape(c['company'])} — {html.escape(c.get('role') or '')} "
+        f"({c.get('status') or 'applied'})"
+        for c in candidates
+    ]
+    await update.message.reply_text(
+        f"🤔 <b>Which company?</b>\n"
+        f"<b>{html.escape(company)}</b> could be:\n\n" + "\n".join(lines) +
+        "\n\nNothing was changed. Send the command again with the full company name.",
+        parse_mode="HTML"
     )
-    results = response.json()
-    return results[0] if results else None
+    return None
 
 
 # ============================================================
@@ -105,6 +128,9 @@ async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "<b>📈 View data</b>\n"
         "• <code>/stats</code> — View all-time stats\n"
         "• <code>/list</code> — View this week's applications\n\n"
+        "<b>📦 Bulk</b>\n"
+        "• <code>/import</code> — Send a CSV/JSON file with this caption\n"
+        "• <code>/export [csv|json]</code> — Download all applications\n\n"
         "• <code>/help</code> — Show this message",
         parse_mode="HTML"
     )
@@ -129,9 +155,8 @@ async def cmd_applied(update: Update, context: ContextTypes.DEFAULT_TYPE):
     company = args[0]
     role = " ".join(args[1:])
 
-    db_insert({"company": company, "role": role, "status": "applied"})
-    all_apps = db_get_all()
-    total = len(all_apps)
+    await db_insert({"company": company, "role": role, "status": "applied"})
+    total = await APPLICATIONS.count()
 
     await update.message.reply_text(
         f"✅ <b>Application logged!</b>\n\n"
@@ -152,18 +177,16 @@ async def cmd_interview(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     company = " ".join(context.args)
-    app = find_application(company)
-
+    app = await find_application(
+        update, company,
+        f"❌ <b>No application found</b>\n"
+        f"Company: <b>{company}</b>\n\n"
+        f"Log it first with:\n<code>/applied &lt;company&gt; &lt;role&gt;</code>",
+    )
     if not app:
-        await update.message.reply_text(
-            f"❌ <b>No application found</b>\n"
-            f"Company: <b>{company}</b>\n\n"
-            f"Log it first with:\n<code>/applied &lt;company&gt; &lt;role&gt;</code>",
-            parse_mode="HTML"
-        )
         return
 
-    db_update(app["id"], {"status": "interview", "interview_date": datetime.now(timezone.utc).isoformat()})
+    await db_update(app["id"], {"status": "interview", "interview_date": datetime.now(timezone.utc).isoformat()})
 
     await update.message.reply_text(
         f"🎯 <b>Interview stage!</b>\n\n"
@@ -182,20 +205,17 @@ async def cmd_rejected(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     company = " ".join(context.args)
-    app = find_application(company)
-
+    app = await find_application(
+        update, company,
+        f"❌ <b>No application found</b>\n"
+        f"Company: <b>{company}</b>",
+    )
     if not app:
-        await update.message.reply_text(
-            f"❌ <b>No application found</b>\n"
-            f"Company: <b>{company}</b>",
-            parse_mode="HTML"
-        )
         return
 
-    db_update(app["id"], {"status": "rejected"})
-    all_apps = db_get_all()
-    total = len(all_apps)
-    rejections = len([a for a in all_apps if a.get("status") == "rejected"])
+    await db_update(app["id"], {"status": "rejected"})
+    total = await APPLICATIONS.count()
+    rejections = await APPLICATIONS.count("rejected")
 
     await update.message.reply_text(
         f"❌ <b>Rejection logged</b>\n\n"
@@ -215,17 +235,15 @@ async def cmd_offer(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     company = " ".join(context.args)
-    app = find_application(company)
-
+    app = await find_application(
+        update, company,
+        f"❌ <b>No application found</b>\n"
+        f"Company: <b>{company}</b>",
+    )
     if not app:
-        await update.message.reply_text(
-            f"❌ <b>No application found</b>\n"
-            f"Company: <b>{company}</b>",
-            parse_mode="HTML"
-        )
         return
 
-    db_update(app["id"], {"status": "offer"})
+    await db_update(app["id"], {"status": "offer"})
 
     await update.message.reply_text(
         f"🎉 <b>OFFER RECEIVED!</b>\n\n"
@@ -236,9 +254,11 @@ async def cmd_offer(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    all_apps = db_get_all()
+    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    stats = await APPLICATIONS.stats(week_ago)
+    total = stats["total"]
 
-    if not all_apps:
+    if not total:
         await update.message.reply_text(
             "📊 <b>No applications logged yet</b>\n\n"
             "Start with:\n<code>/applied &lt;company&gt; &lt;role&gt;</code>",
@@ -246,15 +266,13 @@ async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    total = len(all_apps)
-    interviews = len([a for a in all_apps if a.get("status") == "interview"])
-    rejected = len([a for a in all_apps if a.get("status") == "rejected"])
-    offers = len([a for a in all_apps if a.get("status") == "offer"])
-    pending = len([a for a in all_apps if a.get("status") == "applied"])
+    by_status = stats["by_status"]
+    interviews = by_status.get("interview", 0)
+    rejected = by_status.get("rejected", 0)
+    offers = by_status.get("offer", 0)
+    pending = by_status.get("applied", 0)
     interview_rate = round((interviews / total * 100), 1) if total > 0 else 0
-
-    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    this_week = len([a for a in all_apps if datetime.fromisoformat(a["date"]) > week_ago])
+    this_week = stats["this_week"]
 
     await update.message.reply_text(
         f"📊 <b>Application Stats</b>\n"
@@ -273,9 +291,7 @@ async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def cmd_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    all_apps = db_get_all()
-
-    if not all_apps:
+    if not await APPLICATIONS.count():
         await update.message.reply_text(
             "📋 <b>No applications logged yet</b>\n\n"
             "Start with:\n<code>/applied &lt;company&gt; &lt;role&gt;</code>",
@@ -284,7 +300,7 @@ async def cmd_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    this_week = [a for a in all_apps if datetime.fromisoformat(a["date"]) > week_ago]
+    this_week = await APPLICATIONS.since(week_ago)
 
     if not this_week:
         await update.message.reply_text(
@@ -318,20 +334,14 @@ async def cmd_delete(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     company = " ".join(context.args)
-    app = find_application(company)
-
+    app = await find_application(
+        update, company,
+        f"❌ No application found for <b>{company}</b>.",
+    )
     if not app:
-        await update.message.reply_text(
-            f"❌ No application found for <b>{company}</b>.",
-            parse_mode="HTML"
-        )
         return
 
-    requests.delete(
-        f"{SUPABASE_URL}/rest/v1/applications?id=eq.{app['id']}",
-        headers=SUPABASE_HEADERS,
-        timeout=10
-    )
+    await db_delete(app["id"])
 
     await update.message.reply_text(
         f"🗑 <b>Application deleted</b>\n\n"
@@ -352,14 +362,20 @@ async def cmd_edit(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "• applied\n• interview\n• rejected\n• offer\n\n"
             "<b>Examples</b>\n"
             "<code>/edit Noon role Backend Engineer</code>\n"
-            "<code>/edit Noon status interview</code>",
+            "<code>/edit Noon status interview</code>\n"
+            "<code>/edit Emirates NBD notes Second round</code>",
             parse_mode="HTML"
         )
         return
 
-    company = context.args[0]
-    field = context.args[1].lower()
-    value = " ".join(context.args[2:])
+    # The company may be several words: it runs up to the field name
+    args = context.args
+    split = next(
+        (i for i in range(1, len(args) - 1) if args[i].lower() in ("role", "status", "notes")), 1,
+    )
+    company = " ".join(args[:split])
+    field = args[split].lower()
+    value = " ".join(args[split + 1:])
 
     if field not in ["role", "status", "notes"]:
         await update.message.reply_text(
@@ -377,16 +393,14 @@ async def cmd_edit(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    app = find_application(company)
-
+    app = await find_application(
+        update, company,
+        f"❌ No application found for <b>{company}</b>.",
+    )
     if not app:
-        await update.message.reply_text(
-            f"❌ No application found for <b>{company}</b>.",
-            parse_mode="HTML"
-        )
         return
 
-    db_update(app["id"], {field: value})
+    await db_update(app["id"], {field: value})
 
     await update.message.reply_text(
         f"✏️ <b>Application updated</b>\n\n"
@@ -396,15 +410,108 @@ async def cmd_edit(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
 
+IMPORT_USAGE = (
+    "❌ <b>Usage</b>\n"
+    "Send a CSV or JSON file with the caption <code>/import</code>, "
+    "or reply <code>/import</code> to one.\n\n"
+    "<b>Columns</b>\n"
+    "• company, role (required)\n"
+    "• status, date, interview_date, notes\n\n"
+    "<b>Example CSV</b>\n"
+    "<code>company,role,status,date\n"
+    "Noon,Backend Engineer,applied,2026-10-01</code>"
+)
+
+
+async def cmd_import(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    message = update.effective_message
+    replied = message.reply_to_message
+    document = message.document or (replied.document if replied else None)
+    if not document:
+        await message.reply_text(IMPORT_USAGE, parse_mode="HTML")
+        return
+    if document.file_size and document.file_size > IMPORT_MAX_BYTES:
+        await message.reply_text(
+            f"❌ <b>File too large</b>\nThe limit is {IMPORT_MAX_BYTES // 1_000_000} MB.",
+            parse_mode="HTML"
+        )
+        return
+
+    data = await (await document.get_file()).download_as_bytearray()
+
+    # Each batch is inserted as soon as it has been validated, with one request
+    errors, imported, failure = [], 0, None
+    try:
+        for batch in application_io.batches(application_io.read_rows(data, document.file_name), errors):
+            imported += len(await APPLICATIONS.insert_many(batch))
+    except ValueError as e:
+        failure = f"Couldn't read the file: {e}"
+    except PostgrestError as e:
+        failure = f"The database refused a batch: {e}"
+
+    text = f"📥 <b>Import {'stopped' if failure else 'finished'}</b>\n\nImported: <b>{imported}</b>\n"
+    if failure:
+        text += f"\n⚠️ {html.escape(failure, quote=False)}\n"
+    if errors:
+        text += f"Skipped: <b>{len(errors)}</b>\n\n"
+        text += "".join(
+            f"• line {line}: {html.escape(reason, quote=False)}\n" for line, reason in errors[:5]
+        )
+        if len(errors) > 5:
+            text += f"• … and {len(errors) - 5} more\n"
+    await message.reply_text(text, parse_mode="HTML")
+
+
+async def cmd_export(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    fmt = context.args[0].lower() if context.args else "csv"
+    if fmt not in application_io.FORMATS:
+        await update.message.reply_text(
+            "❌ <b>Usage</b>\n<code>/export [csv|json]</code>", parse_mode="HTML"
+        )
+        return
+
+    # Spills to disk past 1 MB, so a long history isn't held in memory twice
+    with tempfile.SpooledTemporaryFile(max_size=1_000_000) as fh:
+        count = await application_io.export(APPLICATIONS.pages(), fmt, fh)
+        if not count:
+            await update.message.reply_text("📭 No applications to export yet.")
+            return
+        fh.seek(0)
+        await update.message.reply_document(
+            document=fh,
+            filename=f"applications-{datetime.now().strftime('%Y-%m-%d')}.{fmt}",
+            caption=f"📤 {count} applications",
+        )
+
+
+async def on_error(update: object, context: ContextTypes.DEFAULT_TYPE):
+    logging.error("Update %s caused an error", update, exc_info=context.error)
+    if isinstance(update, Update) and update.effective_message:
+        await update.effective_message.reply_text(
+            "⚠️ Couldn't reach the database — please try again in a moment."
+        )
+
+
+async def close_db(application: Application):
+    await DB.close()
+    APPLICATIONS.close()
+
+
 # ============================================================
 # MAIN
 # ============================================================
 
-def main():
-    import asyncio
-    asyncio.set_event_loop(asyncio.new_event_loop())
-    print("Starting JobHunter Bot...")
-    app = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+def build_application():
+    # Updates are handled concurrently: database calls are awaited, so one
+    # slow request no longer holds up everyone else's commands
+    app = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .base_url(f"{TELEGRAM_API_URL}/bot")
+        .concurrent_updates(True)
+        .post_shutdown(close_db)
+        .build()
+    )
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("help", cmd_help))
     app.add_handler(CommandHandler("applied", cmd_applied))
@@ -415,8 +522,43 @@ def main():
     app.add_handler(CommandHandler("offer", cmd_offer))
     app.add_handler(CommandHandler("stats", cmd_stats))
     app.add_handler(CommandHandler("list", cmd_list))
-    print("Bot is running. Send /help to your bot on Telegram.")
-    app.run_polling(allowed_updates=Update.ALL_TYPES)
+    app.add_handler(CommandHandler("import", cmd_import))
+    # A document captioned /import isn't a command message, so match the caption
+    app.add_handler(MessageHandler(filters.Document.ALL & filters.CaptionRegex(r"^/import\b"), cmd_import))
+    app.add_handler(CommandHandler("export", cmd_export))
+    app.add_error_handler(on_error)
+    if SCHEDULER_ENABLED:
+        import scheduler
+        scheduler.schedule_jobs(app)
+    return app
+
+
+def main():
+    # PTB 20.7's run_polling/run_webhook fetch the loop with
+    # asyncio.get_event_loop(), which warns from Python 3.12 (and fails
+    # from 3.14) when the main thread has no loop set, so set one first
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    print(f"Starting JobHunter Bot ({BOT_MODE})...")
+    app = build_application()
+
+    if BOT_MODE == "webhook":
+        if not WEBHOOK_URL or not WEBHOOK_SECRET:
+            raise SystemExit("BOT_MODE=webhook needs WEBHOOK_URL and WEBHOOK_SECRET")
+        # setWebhook registers the URL and the secret; updates whose
+        # X-Telegram-Bot-Api-Secret-Token header doesn't match get a 403
+        print(f"Bot is listening on {BOT_WEBHOOK_LISTEN}:{WEBHOOK_PORT}/{BOT_WEBHOOK_PATH}. "
+              f"Send /help to your bot on Telegram.")
+        app.run_webhook(
+            listen=BOT_WEBHOOK_LISTEN,
+            port=WEBHOOK_PORT,
+            url_path=BOT_WEBHOOK_PATH,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{BOT_WEBHOOK_PATH}",
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=Update.ALL_TYPES,
+        )
+    else:
+        print("Bot is running. Send /help to your bot on Telegram.")
+        app.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""
+company_index.py
+In-memory fuzzy index of company names for the bot's lookup commands.
+
+Names are normalized the way dedup.py normalizes them ("noon.com LLC" and
+"Noon" are the same company) and split into padded character trigrams. A
+lookup only scores the names that share a trigram with the argument, so it
+costs a few set lookups however long the application history gets. Each
+name maps to the applications logged against it; the newest one is the
+one a command acts on, and only when the match is unambiguous().
+"""
+
+import heapq
+import re
+from collections import defaultdict
+
+from dedup import normalize_company
+from config import COMPANY_MATCH_MIN, COMPANY_MATCH_CANDIDATES
+
+EXACT = 1.0
+PREFIX = 0.95
+WORD_START = 0.9
+
+
+def unambiguous(ranked):
+    """
+    Whether the top of search()'s ranking is safe to act on: an exact name,
+    or the only name at prefix level.
+    """
+    if not ranked:
+        return False
+    if ranked[0][0] >= EXACT:
+        return True
+    return ranked[0][0] >= PREFIX and (len(ranked) == 1 or ranked[1][0] < PREFIX)
+
+
+def _key(company):
+    return normalize_company(company) or company.lower().strip()
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CompanyIndex:
+    def __init__(self):
+        self._grams = defaultdict(set)   # trigram -> names
+        self._names = {}                 # name -> {application id: date}
+        self._sizes = {}                 # name -> trigram count
+        self._ids = {}                   # application id -> name
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, app_id, company, date=None):
+        """Index an application, moving it if its company changed."""
+        key = _key(company or "")
+        if self._ids.get(app_id) == key:
+            self._names[key][app_id] = date or ""
+            return
+        self.remove(app_id)
+        if key not in self._names:
+            self._names[key] = {}
+            grams = _trigrams(key)
+            self._sizes[key] = len(grams)
+            for gram in grams:
+                self._grams[gram].add(key)
+        self._names[key][app_id] = date or ""
+        self._ids[app_id] = key
+
+    def remove(self, app_id):
+        key = self._ids.pop(app_id, None)
+        if key is None:
+            return
+        apps = self._names[key]
+        apps.pop(app_id, None)
+        if apps:
+            return
+        del self._names[key]
+        del self._sizes[key]
+        for gram in _trigrams(key):
+            self._grams[gram].discard(key)
+            if not self._grams[gram]:
+                del self._grams[gram]
+
+    def clear(self):
+        self._grams.clear()
+        self._names.clear()
+        self._sizes.clear()
+        self._ids.clear()
+
+    def _score(self, query, name, shared, query_size, partial=True):
+        """
+        Exact beats prefix beats substring beats trigram similarity.
+        partial=False skips the prefix and substring tiers.
+        """
+        if name == query:
+            return EXACT
+        if partial and name.startswith(query):
+            return PREFIX
+        # A later word starting with the query shares every trigram but the
+        # query's first and last; checking that first skips most substring tests
+        if partial and shared >= query_size - 2 and query in name:
+            return WORD_START
+        return 2 * shared / (query_size + self._sizes[name])
+
+    def search(self, company, limit=COMPANY_MATCH_CANDIDATES):
+        """
+        Ranked matches for company: a list of (score, name, application ID),
+        best first, with the newest application for each name.
+        """
+        query = _key(company)
+        if not query:
+            return []
+        # Normalizing "Emirates Group" leaves "emirates": a prefix of that
+        # says nothing about the word the user actually typed
+        partial = len(query.split()) >= len(re.findall(r"\w+", company.lower()))
+        query_grams = _trigrams(query)
+        shared = defaultdict(int)
+        for gram in query_grams:
+            for name in self._grams.get(gram, ()):
+                shared[name] += 1
+
+        ranked = []
+        size = len(query_grams)
+        for name, count in shared.items():
+            score = self._score(query, name, count, size, partial)
+            if score < COMPANY_MATCH_MIN:
+                continue
+            apps = self._names[name]
+            app_id = max(apps, key=lambda i: (apps[i], i))
+            # Ties go to the company applied to most recently
+            ranked.append((score, apps[app_id], name, app_id))
+        best = heapq.nlargest(limit, ranked)
+        return [(score, name, app_id) for score, _, name, app_id in best]
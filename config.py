@@ -69,12 +69,176 @@ REJECTION_KEYWORDS = [
     "minimum 3", "minimum 4", "minimum 5", "at least 3 years", "at least 4 years",
 ]
 
+# Rejections that still apply when a job is re-scored on its description.
+# Single words like "sales" or "devops" are fine in a title but turn up in
+# any description ("partner with our sales team"), so only phrases that
+# state a hard requirement are checked there, as whole words.
+DESCRIPTION_REJECTION_KEYWORDS = [
+    "nationals only", "uae nationals", "saudi nationals", "qatari nationals",
+    "door to door", "2-4 years", "3-5 years", "4-6 years",
+    "at least 3 years", "at least 4 years",
+    "minimum 3 years", "minimum 4 years", "minimum 5 years",
+]
+
 # --- Telegram Safety ---
 TELEGRAM_MAX_CHARS = 3900    # Telegram limit is 4096, leave margin
-TELEGRAM_SEND_DELAY_SEC = 1.1
+TELEGRAM_SEND_DELAY_SEC = 1.1  # Min gap between messages to the same chat
+
+# --- Telegram delivery ---
+TELEGRAM_API_URL = "https://api.telegram.org"
+TELEGRAM_GLOBAL_RATE = 30      # Bot API limit: ~30 messages/sec across all chats
+TELEGRAM_CHAT_BURST = 1        # Messages a chat may receive back-to-back
+TELEGRAM_MAX_RETRIES = 4       # Retries after a 429, 5xx or network error
+TELEGRAM_BACKOFF_BASE_SEC = 1.0
 
-# --- File to track seen jobs ---
+# --- Seen jobs store ---
+SEEN_JOBS_DB = "seen_jobs.db"
+# IDs not found by any search for this many days are forgotten
+SEEN_JOBS_TTL_DAYS = 30
+# Legacy list, imported into SEEN_JOBS_DB once on first run
 SEEN_JOBS_FILE = "seen_jobs.json"
 
 # --- Max jobs per notification message ---
-MAX_JOBS_PER_MESSAGE = 10
\ No newline at end of file
+MAX_JOBS_PER_MESSAGE = 10
+
+# --- Fetch concurrency / politeness ---
+# All searches run at once; each host gets its own concurrency cap and a
+# minimum gap between request starts so no board sees a burst.
+FETCH_HOST_CONCURRENCY = 2
+FETCH_HOST_MIN_INTERVAL_SEC = 2.0
+FETCH_HOST_LIMITS = {
+    # host: (max concurrent requests, min seconds between request starts)
+    "www.linkedin.com": (2, 3.0),
+    # Telegram pacing is handled by telegram_sender's token buckets
+    "api.telegram.org": (4, 0.0),
+}
+
+# --- Per-host circuit breaker ---
+# Blocked (403/429/999), failing (5xx, timeouts) or suddenly empty boards
+# are backed off with jittered exponential delays, and skipped for the rest
+# of the run once they cross a threshold of consecutive bad responses.
+CIRCUIT_FAILURE_THRESHOLD = 3     # Consecutive failed requests
+CIRCUIT_EMPTY_THRESHOLD = 6       # Consecutive queries with no listings on page one
+CIRCUIT_FAILURE_STATUSES = (403, 429, 999)   # Plus every 5xx
+CIRCUIT_BACKOFF_BASE_SEC = 2.0
+CIRCUIT_BACKOFF_MAX_SEC = 30.0
+
+# --- HTTP connection pooling ---
+# One keep-alive session per host; size the pool to at least the host's
+# concurrency cap so connections are reused instead of reopened.
+HTTP_POOL_MAXSIZE = 4
+HTTP_POOL_BLOCK = False
+HTTP_MAX_RETRIES = 0
+
+# --- Response cache ---
+# Search pages are cached between runs; unchanged pages skip parsing.
+RESPONSE_CACHE_FILE = "response_cache.db"
+RESPONSE_CACHE_TTL_HOURS = 24
+RESPONSE_CACHE_MAX_ENTRIES = 500
+RESPONSE_CACHE_MAX_BYTES = 5 * 1024 * 1024
+
+# --- HTML parsing ---
+# "lxml" is much faster than "html.parser"; the scraper falls back to
+# html.parser automatically if lxml isn't installed.
+HTML_PARSER = "lxml"
+# Only build the tree for each board's listing containers, not the whole page
+PARSE_ONLY_LISTINGS = True
+# Upper bound on listings read from one search results page
+MAX_LISTINGS_PER_PAGE = 50
+
+# --- Pagination ---
+# Each (board, keyword, location) query follows result pages until it
+# reaches listings the previous run already read (its watermark) or a page
+# whose matches have all been seen. The first run of a query reads one page.
+MAX_PAGES_PER_QUERY = 5
+WATERMARK_SIZE = 10   # Listing IDs from the top of page one kept per query
+
+# --- Near-duplicate detection ---
+# The same opening posted on several boards is sent once. Jobs at the same
+# (normalized) company and seniority whose titles are at least this
+# similar (Jaccard over title words and word pairs) are merged.
+DEDUP_ENABLED = True
+DEDUP_SIMILARITY = 0.75
+DEDUP_NUM_PERM = 64   # MinHash signature length
+DEDUP_BANDS = 16      # LSH bands; DEDUP_NUM_PERM must divide evenly
+
+# --- Job description enrichment ---
+# Listings that pass the title filter get their job page fetched and are
+# re-scored on the full description (years of experience, "nationals
+# only", tech stack...). Descriptions are cached per job ID.
+ENRICH_DESCRIPTIONS = True
+ENRICH_MAX_WORKERS = 4          # Job pages fetched at once (per-host limits still apply)
+ENRICH_MAX_FETCHES = 60         # Job pages fetched per run; the rest keep their title score
+ENRICH_MAX_CHARS = 20000        # Description text kept per job
+ENRICH_CACHE_DAYS = 14
+
+# --- Query planner ---
+# Overlapping keywords mostly return the same listings. Each query's yield
+# (new jobs it alone contributed) is tracked across runs; once a query has
+# PLANNER_MIN_RUNS observations and its average yield drops below
+# PLANNER_MIN_YIELD it is skipped, except that the PLANNER_EXPLORE_BUDGET
+# longest-skipped queries are rechecked every run.
+PLANNER_ENABLED = True
+PLANNER_MIN_RUNS = 3
+PLANNER_MIN_YIELD = 0.2     # New jobs per run (moving average)
+PLANNER_DECAY = 0.3         # Weight of the latest run in the moving averages
+PLANNER_EXPLORE_BUDGET = 2  # Skipped queries run anyway each run
+
+# --- Run metrics ---
+# Per-stage timings and counters written at the end of every scraper run
+METRICS_JSON_FILE = "run_metrics.json"
+METRICS_PROM_FILE = "run_metrics.prom"
+
+# --- Supabase client (bot.py) ---
+SUPABASE_TIMEOUT_SEC = 10
+SUPABASE_CONNECT_TIMEOUT_SEC = 5
+SUPABASE_POOL_SIZE = 10         # Keep-alive connections shared by all handlers
+SUPABASE_MAX_RETRIES = 2
+SUPABASE_BACKOFF_BASE_SEC = 0.5
+
+# --- Applications replica ---
+# bot.py reads applications from a local SQLite copy that pulls only rows
+# changed since its last sync (see migrations/001).
+APPLICATIONS_DB = "applications.db"
+APPLICATIONS_SYNC_SEC = 60      # Reads within this long of a sync skip the network
+APPLICATIONS_SYNC_PAGE = 1000   # Rows per request when catching up
+
+# --- Company matching (bot.py) ---
+# /interview, /rejected, /offer, /edit and /delete resolve the company they
+# are given against an in-memory trigram index of the replica's companies.
+# They only act on an exact name, or on the one name the argument is a
+# prefix of; anything looser gets the ranked candidates back instead.
+COMPANY_MATCH_MIN = 0.4         # Trigram similarity below which a name isn't a match
+COMPANY_MATCH_CANDIDATES = 5    # Ranked names kept per lookup
+
+# --- Bot serving mode (bot.py) ---
+# "polling" long-polls getUpdates; "webhook" serves an HTTPS endpoint that
+# Telegram pushes updates to. Webhook mode also needs WEBHOOK_URL (the
+# public base URL) and WEBHOOK_SECRET in the environment.
+BOT_MODE = "polling"
+BOT_WEBHOOK_LISTEN = "0.0.0.0"
+BOT_WEBHOOK_PORT = 8443         # Overridden by $PORT where the host sets one
+BOT_WEBHOOK_PATH = "telegram"
+
+# --- Bulk import/export (bot.py) ---
+IMPORT_BATCH_SIZE = 500         # Rows per multi-row insert
+IMPORT_MAX_BYTES = 5_000_000    # Largest document /import will download
+IMPORT_MAX_ROWS = 5000
+EXPORT_PAGE_SIZE = 500          # Rows read from the replica at a time
+
+# --- Daily question deck ---
+# Flagged questions come back after QUESTION_REVIEW_FIRST_DAYS, then at
+# doubling intervals up to QUESTION_REVIEW_MAX_DAYS until unflagged.
+QUESTION_REVIEW_FIRST_DAYS = 1
+QUESTION_REVIEW_MAX_DAYS = 32
+
+# --- Scheduler (bot.py) ---
+# The bot runs the scraper, the daily question and the weekly summary
+# itself on these UAE-time schedules, in place of GitHub Actions cron jobs.
+# Set SCHEDULER_ENABLED=false in the environment to run the bot alone.
+SCHEDULER_ENABLED = True
+SCHEDULE_TIMEZONE = "Asia/Dubai"
+SCRAPE_TIMES = ("07:00", "11:00", "17:00")
+QUESTION_TIME = "08:00"
+SUMMARY_TIME = "09:00"
+SUMMARY_DAYS = (0,)             # 0 = Sunday ... 6 = Saturday
@@ -1,18 +1,23 @@
 """
 daily_question.py
 Sends one technical and one behavioural interview question every morning.
-Runs via GitHub Actions on a schedule.
+Runs on a schedule inside bot.py (scheduler.py), or by hand.
+
+Questions are dealt from a shuffled deck per category (question_deck.py).
+To have a question come back for review, or to stop it coming back:
+  python daily_question.py --flag technical 12
+  python daily_question.py --unflag technical 12
 """
 
 import os
+import sys
 import json
-import random
-import requests
 from datetime import datetime
-from dotenv import load_dotenv
+from env import load_env
 from questions import TECHNICAL_QUESTIONS, BEHAVIOURAL_QUESTIONS
+from question_deck import QuestionDeck, migrate
 
-load_dotenv()
+load_env()
 
 from config import (
     TELEGRAM_BOT_TOKEN as _CONFIG_TOKEN,
@@ -24,67 +29,86 @@ TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", _CONFIG_CHAT_ID)
 
 SEEN_QUESTIONS_FILE = "seen_questions.json"
 
+CATEGORIES = {
+    "technical": TECHNICAL_QUESTIONS,
+    "behavioural": BEHAVIOURAL_QUESTIONS,
+}
+
 
-def load_seen_questions():
+def load_decks():
+    """One QuestionDeck per category, converting the old list-of-texts format."""
+    state = {}
     if os.path.exists(SEEN_QUESTIONS_FILE):
         with open(SEEN_QUESTIONS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {"technical": [], "behavioural": []}
+            state = json.load(f)
+    decks = {}
+    for category, questions in CATEGORIES.items():
+        saved = state.get(category)
+        if isinstance(saved, list):
+            saved = migrate(questions, saved)
+        decks[category] = QuestionDeck(questions, saved)
+    return decks
 
 
-def save_seen_questions(seen):
+def save_decks(decks):
     with open(SEEN_QUESTIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump(seen, f)
-
-
-def pick_question(questions, seen_list):
-    """Pick a question not seen recently. Reset if all seen."""
-    unseen = [q for q in questions if q not in seen_list]
-    if not unseen:
-        seen_list.clear()
-        unseen = questions
-    question = random.choice(unseen)
-    seen_list.append(question)
-    return question
+        json.dump({category: deck.state for category, deck in decks.items()}, f, sort_keys=True)
+
+
+def flag_question(args):
+    """--flag/--unflag <category> <id>: edit the review schedule without sending."""
+    if len(args) != 3 or args[1] not in CATEGORIES or not args[2].isdigit():
+        print("Usage: python daily_question.py --flag|--unflag technical|behavioural <id>")
+        sys.exit(2)
+    action, category, qid = args[0], args[1], int(args[2])
+    decks = load_decks()
+    deck = decks[category]
+    if action == "--flag":
+        try:
+            deck.flag(qid)
+        except KeyError:
+            print(f"No {category} question #{qid}")
+            sys.exit(1)
+        print(f"Flagged {category} #{qid}: {CATEGORIES[category][qid]}")
+    elif deck.unflag(qid):
+        print(f"Unflagged {category} #{qid}")
+    else:
+        print(f"{category} #{qid} wasn't flagged")
+    save_decks(decks)
 
 
 def send_telegram_message(text):
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": text,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": True,
-    }
-    response = requests.post(url, json=payload, timeout=10)
-    if response.status_code != 200:
-        print(f"[Telegram] Failed: {response.text}")
-    else:
+    # Imported only when sending: --flag/--unflag never need requests or asyncio
+    from telegram_sender import shared_sender
+    if shared_sender(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID).deliver([text]):
         print("[Telegram] Question sent!")
 
 
 def main():
     print(f"Daily Question Sender — {datetime.now().strftime('%d %b %Y %H:%M')}")
 
-    seen = load_seen_questions()
+    decks = load_decks()
 
-    tech_q = pick_question(TECHNICAL_QUESTIONS, seen["technical"])
-    behav_q = pick_question(BEHAVIOURAL_QUESTIONS, seen["behavioural"])
+    tech_id = decks["technical"].draw()
+    behav_id = decks["behavioural"].draw()
 
     message = (
         f"🧠 <b>Daily Interview Prep — {datetime.now().strftime('%d %b %Y')}</b>\n"
         f"{'─' * 30}\n\n"
-        f"💻 <b>Technical Question</b>\n"
-        f"{tech_q}\n\n"
-        f"🗣 <b>Behavioural Question</b>\n"
-        f"{behav_q}\n\n"
+        f"💻 <b>Technical Question</b> <i>#{tech_id}</i>\n"
+        f"{TECHNICAL_QUESTIONS[tech_id]}\n\n"
+        f"🗣 <b>Behavioural Question</b> <i>#{behav_id}</i>\n"
+        f"{BEHAVIOURAL_QUESTIONS[behav_id]}\n\n"
         f"<i>Take 2 minutes to think through your answer before reading on today.</i>"
     )
 
     send_telegram_message(message)
-    save_seen_questions(seen)
+    save_decks(decks)
     print("Done!")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] in (["--flag"], ["--unflag"]):
+        flag_question(sys.argv[1:])
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""
+dedup.py
+Cross-board near-duplicate detection.
+
+The same opening often appears on several boards with small differences
+("Noon" vs "noon.com LLC", "Sr. Full-Stack Dev" vs "Senior Full Stack
+Developer"), which gives it a different make_job_id(). Titles and
+companies are normalized, each job gets a MinHash signature over its title
+words and word pairs, and signatures are bucketed by LSH band together
+with the normalized company and the title's seniority/level words, so
+"Junior" and "Senior" or "Engineer" and "Engineer II" never meet. Finding
+candidates is then a handful of indexed bucket lookups no matter how large
+the history is; only candidates that share a bucket have their normalized
+titles compared, on exact Jaccard similarity.
+
+The history lives next to the seen-jobs table in SEEN_JOBS_DB.
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import struct
+import threading
+import time
+
+from config import (
+    SEEN_JOBS_DB, SEEN_JOBS_TTL_DAYS,
+    DEDUP_SIMILARITY, DEDUP_NUM_PERM, DEDUP_BANDS,
+)
+
+# ============================================================
+# NORMALIZATION
+# ============================================================
+
+_COMPANY_SUFFIXES = {
+    "llc", "l.l.c", "fz", "fze", "fzco", "fz-llc", "fzllc", "dmcc", "ltd",
+    "limited", "inc", "incorporated", "co", "corp", "corporation", "company",
+    "plc", "pjsc", "psc", "wll", "w.l.l", "spc", "saoc", "est", "establishment",
+    "group", "holding", "holdings", "gmbh", "bv", "sa", "ag",
+}
+_DOMAIN = re.compile(r"\.(?:com|net|org|io|ae|sa|qa|om|co|ai)\b")
+_NON_WORD = re.compile(r"[^\w.+#]+")
+
+_TITLE_SYNONYMS = {
+    "sr": "senior", "sr.": "senior", "snr": "senior",
+    "jr": "junior", "jr.": "junior",
+    "dev": "developer", "devs": "developer", "eng": "engineer", "engr": "engineer",
+    "swe": "software engineer", "fullstack": "full stack",
+    "frontend": "front end", "backend": "back end",
+    "nodejs": "node.js", "node": "node.js", "reactjs": "react", "react.js": "react",
+    "nextjs": "next.js",
+}
+_TITLE_NOISE = {
+    "urgent", "urgently", "hiring", "required", "needed", "wanted", "job",
+    "vacancy", "opening", "immediate", "joiner", "joiners",
+    "uae", "dubai", "abu", "dhabi", "sharjah", "ajman", "remote", "hybrid", "onsite",
+}
+# Words that make two otherwise similar titles different openings
+_TITLE_LEVELS = {
+    "intern", "internship", "trainee", "graduate", "junior", "associate", "mid",
+    "senior", "lead", "staff", "principal", "head",
+    "i", "ii", "iii", "iv", "1", "2", "3", "4",
+}
+
+
+def normalize_company(name):
+    name = _DOMAIN.sub(" ", name.lower())
+    tokens = [t.strip(".") for t in _NON_WORD.split(name)]
+    tokens = [t for t in tokens if t and t not in _COMPANY_SUFFIXES and t != "the"]
+    return " ".join(tokens)
+
+
+def normalize_title(title):
+    words = []
+    for token in _NON_WORD.split(title.lower().replace("/", " ")):
+        token = token.strip(".") if token not in _TITLE_SYNONYMS else token
+        if not token or token in _TITLE_NOISE:
+            continue
+        words.extend(_TITLE_SYNONYMS.get(token, token).split())
+    return " ".join(words)
+
+
+# ============================================================
+# MINHASH + LSH
+# ============================================================
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 64) - 1
+
+
+def _hash64(value):
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+
+
+def _shingles(title):
+    """Words plus adjacent word pairs of a normalized title."""
+    words = title.split()
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def _levels(title):
+    return " ".join(sorted(set(title.split()) & _TITLE_LEVELS))
+
+
+def similarity(title_a, title_b):
+    """Jaccard similarity of two normalized titles' shingle sets."""
+    a, b = _shingles(title_a), _shingles(title_b)
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class MinHasher:
+    def __init__(self, num_perm=DEDUP_NUM_PERM, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, title):
+        """Signature of a normalized title."""
+        hashes = [_hash64(s) for s in _shingles(title)] or [0]
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes) & _MASK
+            for a, b in self.perms
+        )
+
+
+def band_keys(scope, signature, bands=DEDUP_BANDS):
+    """One bucket key per LSH band, scoped to the normalized company and title levels."""
+    rows = len(signature) // bands
+    keys = []
+    for band in range(bands):
+        chunk = signature[band * rows:(band + 1) * rows]
+        raw = f"{scope}|{band}|" + ",".join(map(str, chunk))
+        keys.append(struct.unpack("<q", hashlib.blake2b(raw.encode(), digest_size=8).digest())[0])
+    return keys
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_titles (
+    job_id TEXT PRIMARY KEY,
+    title  TEXT NOT NULL,
+    added  REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS job_titles_added ON job_titles (added);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    bucket INTEGER NOT NULL,
+    job_id TEXT NOT NULL,
+    PRIMARY KEY (bucket, job_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS lsh_buckets_job ON lsh_buckets (job_id);
+"""
+
+
+class NearDuplicateIndex:
+    """
+    LSH index over this run's jobs (in memory) and recently seen jobs
+    (SQLite). find_duplicate() returns the ID of an indexed job similar
+    enough to count as the same opening, or None.
+    """
+
+    def __init__(self, path=SEEN_JOBS_DB, threshold=DEDUP_SIMILARITY,
+                 num_perm=DEDUP_NUM_PERM, bands=DEDUP_BANDS,
+                 history_days=SEEN_JOBS_TTL_DAYS):
+        self.threshold = threshold
+        self.bands = bands
+        self.history = history_days * 86400
+        self.hasher = MinHasher(num_perm)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_signatures'"
+        ).fetchone():
+            # History bucketed by the old character-trigram signatures can't
+            # meet the current buckets, so it's rebuilt from scratch
+            self._conn.executescript("DROP TABLE job_signatures; DROP TABLE IF EXISTS lsh_buckets;")
+        self._conn.executescript(_SCHEMA)
+        # Jobs added during this run, written to SQLite by flush()
+        self._pending = {}
+        self._buckets = {}
+        self._computed = {}
+
+    def _keys(self, job):
+        computed = self._computed.get(job["id"])
+        if computed is None:
+            title = normalize_title(job["title"])
+            scope = f"{normalize_company(job['company'])}|{_levels(title)}"
+            keys = band_keys(scope, self.hasher.signature(title), self.bands)
+            computed = self._computed[job["id"]] = (title, keys)
+        return computed
+
+    def find_duplicate(self, job):
+        title, keys = self._keys(job)
+
+        candidates = set()
+        for key in keys:
+            candidates.update(self._buckets.get(key, ()))
+        for job_id in candidates:
+            if similarity(title, self._pending[job_id][0]) >= self.threshold:
+                return job_id
+
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT s.job_id, s.title FROM job_titles s "
+                f"WHERE s.job_id IN (SELECT DISTINCT job_id FROM lsh_buckets WHERE bucket IN ({placeholders}))",
+                keys,
+            ).fetchall()
+        for job_id, other in rows:
+            if similarity(title, other) >= self.threshold:
+                return job_id
+        return None
+
+    def add(self, job):
+        title, keys = self._keys(job)
+        self._pending[job["id"]] = (title, keys)
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(job["id"])
+
+    def flush(self, now=None):
+        """Persist jobs added this run and drop history older than the window."""
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO job_titles (job_id, title, added) VALUES (?, ?, ?)",
+                ((job_id, title, now) for job_id, (title, _) in self._pending.items()),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO lsh_buckets (bucket, job_id) VALUES (?, ?)",
+                ((key, job_id) for job_id, (_, keys) in self._pending.items() for key in keys),
+            )
+            cutoff = now - self.history
+            self._conn.execute(
+                "DELETE FROM lsh_buckets WHERE job_id IN "
+                "(SELECT job_id FROM job_titles WHERE added < ?)", (cutoff,)
+            )
+            self._conn.execute("DELETE FROM job_titles WHERE added < ?", (cutoff,))
+        self._pending.clear()
+        self._buckets.clear()
+        self._computed.clear()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
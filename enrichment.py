@@ -0,0 +1,154 @@
+"""
+enrichment.py
+Second scoring stage: fetch a job's own page and re-score it on the full
+description, not just the title.
+
+Only jobs that already passed the title filter and are new this run reach
+this stage. Descriptions are cached per job ID, so a posting's page is
+fetched at most once while it's in the cache, and fetches per run are
+capped by ENRICH_MAX_FETCHES.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import transport
+from metrics import METRICS
+from boards import BOARDS_BY_NAME, extract_description
+from scoring import score_text
+from config import (
+    RESPONSE_CACHE_FILE, MIN_SCORE,
+    ENRICH_MAX_WORKERS, ENRICH_MAX_FETCHES, ENRICH_MAX_CHARS, ENRICH_CACHE_DAYS,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS descriptions (
+    job_id     TEXT PRIMARY KEY,
+    text       TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS descriptions_fetched_at ON descriptions (fetched_at);
+"""
+
+
+class DescriptionCache:
+    def __init__(self, path=RESPONSE_CACHE_FILE, ttl_days=ENRICH_CACHE_DAYS):
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM descriptions WHERE job_id = ? AND fetched_at >= ?",
+                (job_id, time.time() - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, job_id, text):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO descriptions (job_id, text, fetched_at) VALUES (?, ?, ?)",
+                (job_id, text, time.time()),
+            )
+
+    def expire(self):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM descriptions WHERE fetched_at < ?", (time.time() - self.ttl,)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class Enricher:
+    def __init__(self, headers, cache=None, max_workers=ENRICH_MAX_WORKERS,
+                 max_fetches=ENRICH_MAX_FETCHES):
+        self.headers = headers
+        self.cache = cache or DescriptionCache()
+        self.max_workers = max_workers
+        self.max_fetches = max_fetches
+        self.fetched = 0
+        self.cached = 0
+        self.rejected = set()
+        self._lock = threading.Lock()
+
+    def _take_fetch(self):
+        with self._lock:
+            if self.fetched >= self.max_fetches:
+                return False
+            self.fetched += 1
+            return True
+
+    def description(self, job):
+        """Cached description text, a freshly fetched one, or None if unavailable."""
+        board = BOARDS_BY_NAME.get(job["source"])
+        if board is None or not board.has_description:
+            return None
+
+        text = self.cache.get(job["id"])
+        if text is not None:
+            with self._lock:
+                self.cached += 1
+            return text
+        if transport.BREAKER.is_open(transport.host_of(job["url"])) or not self._take_fetch():
+            return None
+
+        try:
+            response = transport.get(job["url"], headers=self.headers, timeout=15)
+        except transport.CircuitOpenError:
+            return None
+        except Exception as e:
+            print(f"  [{board.name}] Job page error: {e}")
+            return None
+        if response.status_code != 200:
+            return None
+
+        text = extract_description(board, response.text, ENRICH_MAX_CHARS)
+        # Cache misses too ("") so a page without a description isn't refetched
+        self.cache.put(job["id"], text)
+        return text
+
+    def rescore(self, job):
+        """Re-score job on its description. Returns the job, or None if it no longer qualifies."""
+        with METRICS.timer("enrich", job["source"]):
+            text = self.description(job)
+        if text:
+            with METRICS.timer("score", job["source"]):
+                result = score_text(job["title"], text)
+            if result.score < MIN_SCORE:
+                with self._lock:
+                    self.rejected.add(job["id"])
+                METRICS.inc("rejected", source=job["source"], stage="description")
+                return None
+            job["score"] = result.score
+        return job
+
+    def stream(self, jobs):
+        """
+        Re-score a stream of jobs with bounded concurrency, yielding those
+        that still qualify. At most 2 × max_workers jobs are in flight.
+        """
+        window = self.max_workers * 2
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich") as pool:
+            for job in jobs:
+                in_flight.append(pool.submit(self.rescore, job))
+                while len(in_flight) >= window:
+                    job = in_flight.popleft().result()
+                    if job is not None:
+                        yield job
+            while in_flight:
+                job = in_flight.popleft().result()
+                if job is not None:
+                    yield job
+
+    def close(self):
+        self.cache.expire()
+        self.cache.close()
@@ -0,0 +1,20 @@
+"""
+env.py
+Loads the project's .env file into the environment.
+
+python-dotenv is only imported when there is a .env to read: on GitHub
+Actions and Render the secrets are already in the environment, and the
+scripts start faster without it.
+"""
+
+import os
+
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+
+def load_env(path=ENV_FILE):
+    """Load path (the .env next to the scripts) if it exists. Returns True if it did."""
+    if not os.path.exists(path):
+        return False
+    from dotenv import load_dotenv
+    return load_dotenv(path)
@@ -0,0 +1,145 @@
+"""
+metrics.py
+Per-run timings and counters for the scraper.
+
+Stages (connect, first_byte, download, parse, score, dedup, telegram...)
+accumulate seconds and call counts per source — a host for HTTP stages,
+a board name for the rest. Counters are named totals with labels (HTTP
+status codes, bytes on the wire and decoded, empty pages, rejects). At
+the end of a run both are written as a JSON document and in Prometheus
+text format, ready for node_exporter's textfile collector or a
+pushgateway.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from config import METRICS_JSON_FILE, METRICS_PROM_FILE
+
+PREFIX = "scraper"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+class RunMetrics:
+    def __init__(self):
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._counters = {}
+
+    def reset(self):
+        """Start a new run in a process that stays up between runs."""
+        with self._lock:
+            self.started = time.time()
+            self._stages.clear()
+            self._counters.clear()
+
+    def record(self, stage, source, seconds):
+        with self._lock:
+            entry = self._stages.setdefault((stage, source), [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    @contextmanager
+    def timer(self, stage, source):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, source, time.perf_counter() - start)
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self):
+        with self._lock:
+            stages = {key: tuple(entry) for key, entry in self._stages.items()}
+            counters = dict(self._counters)
+        return stages, counters
+
+    def to_dict(self):
+        stages, counters = self.snapshot()
+        doc = {
+            "started": datetime.fromtimestamp(self.started, timezone.utc).isoformat(),
+            "duration_sec": round(time.time() - self.started, 3),
+            "stages": {},
+            "counters": {},
+        }
+        for (stage, source), (seconds, count) in sorted(stages.items()):
+            doc["stages"].setdefault(stage, {})[source] = {
+                "seconds": round(seconds, 4), "count": count,
+            }
+        for (name, labels), value in sorted(counters.items()):
+            doc["counters"].setdefault(name, []).append({"labels": dict(labels), "value": value})
+        return doc
+
+    def to_prometheus(self):
+        stages, counters = self.snapshot()
+        lines = [
+            f"# HELP {PREFIX}_run_start_time_seconds Unix time the run started.",
+            f"# TYPE {PREFIX}_run_start_time_seconds gauge",
+            f"{PREFIX}_run_start_time_seconds {self.started:.3f}",
+            f"# HELP {PREFIX}_run_duration_seconds Wall time of the run.",
+            f"# TYPE {PREFIX}_run_duration_seconds gauge",
+            f"{PREFIX}_run_duration_seconds {time.time() - self.started:.3f}",
+            f"# HELP {PREFIX}_stage_seconds_total Time spent per stage and source.",
+            f"# TYPE {PREFIX}_stage_seconds_total counter",
+        ]
+        for (stage, source), (seconds, _) in sorted(stages.items()):
+            lines.append(f"{PREFIX}_stage_seconds_total{_labels([('stage', stage), ('source', source)])} {seconds:.6f}")
+        lines += [
+            f"# HELP {PREFIX}_stage_calls_total Times each stage ran per source.",
+            f"# TYPE {PREFIX}_stage_calls_total counter",
+        ]
+        for (stage, source), (_, count) in sorted(stages.items()):
+            lines.append(f"{PREFIX}_stage_calls_total{_labels([('stage', stage), ('source', source)])} {count}")
+
+        names = sorted({name for name, _ in counters})
+        for name in names:
+            lines += [f"# TYPE {PREFIX}_{name}_total counter"]
+            for (counter, labels), value in sorted(counters.items()):
+                if counter == name:
+                    lines.append(f"{PREFIX}_{name}_total{_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path=METRICS_JSON_FILE, prom_path=METRICS_PROM_FILE):
+        # Write then rename so a collector never reads a half-written file
+        for path, text in (
+            (json_path, json.dumps(self.to_dict(), indent=2)),
+            (prom_path, self.to_prometheus()),
+        ):
+            tmp = f"{path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+
+    def print_summary(self, top=5):
+        """The stages that took the most time, summed over their sources."""
+        stages, _ = self.snapshot()
+        totals = {}
+        for (stage, _), (seconds, _) in stages.items():
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        if not totals:
+            return
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+        print("\n[Metrics] Time by stage (summed across threads): " + ", ".join(
+            f"{stage} {seconds:.2f}s" for stage, seconds in ranked
+        ))
+
+
+METRICS = RunMetrics()
@@ -0,0 +1,20 @@
+-- 001_applications_updated_at.sql
+-- Adds the updated_at watermark the bot's local replica syncs on.
+-- Run once in the Supabase SQL editor.
+
+alter table applications
+    add column if not exists updated_at timestamptz not null default now();
+
+create or replace function set_updated_at() returns trigger as $$
+begin
+    new.updated_at = now();
+    return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists applications_updated_at on applications;
+create trigger applications_updated_at
+    before update on applications
+    for each row execute function set_updated_at();
+
+create index if not exists applications_updated_at_idx on applications (updated_at, id);
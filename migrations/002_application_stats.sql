@@ -0,0 +1,26 @@
+-- 002_application_stats.sql
+-- Aggregates for /stats and the weekly summary, computed in Postgres so
+-- clients transfer counts instead of every row.
+-- Run once in the Supabase SQL editor.
+
+create or replace view application_status_counts as
+    select status, count(*)::int as count
+    from applications
+    group by status;
+
+create or replace function application_stats(since timestamptz default now() - interval '7 days')
+returns json
+language sql
+stable
+as $$
+    select json_build_object(
+        'total', (select count(*) from applications),
+        'this_week', (select count(*) from applications where date > since),
+        'by_status', coalesce(
+            (select json_object_agg(status, count) from application_status_counts),
+            '{}'::json
+        )
+    );
+$$;
+
+create index if not exists applications_date_idx on applications (date desc);
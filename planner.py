@@ -0,0 +1,142 @@
+"""
+planner.py
+Yield-driven query planning.
+
+Every (board, keyword, location) query has its listings, relevant jobs,
+new jobs and latency recorded per run as moving averages in SEEN_JOBS_DB.
+"New" counts only jobs no other query had already produced this run, so a
+keyword that overlaps a broader one shows its marginal yield, not its raw
+one. The planner runs the best-yielding queries first, skips those whose
+yield has stayed near zero, and spends a small exploration budget each run
+on the queries skipped longest so they're rechecked periodically. A query
+whose fetch failed this run isn't recorded at all, so a blocked or
+flaky board doesn't read as one with nothing to find.
+"""
+
+import sqlite3
+import threading
+import time
+
+from config import (
+    SEEN_JOBS_DB, SEEN_JOBS_TTL_DAYS, PLANNER_MIN_RUNS, PLANNER_MIN_YIELD, PLANNER_DECAY,
+    PLANNER_EXPLORE_BUDGET,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_stats (
+    board    TEXT NOT NULL,
+    keyword  TEXT NOT NULL,
+    location TEXT NOT NULL,
+    runs     INTEGER NOT NULL,
+    listings REAL NOT NULL,
+    relevant REAL NOT NULL,
+    new      REAL NOT NULL,
+    latency  REAL NOT NULL,
+    last_run REAL NOT NULL,
+    PRIMARY KEY (board, keyword, location)
+) WITHOUT ROWID;
+"""
+
+_FIELDS = ("listings", "relevant", "new", "latency")
+
+
+class QueryPlanner:
+    def __init__(self, path=SEEN_JOBS_DB, min_runs=PLANNER_MIN_RUNS,
+                 min_yield=PLANNER_MIN_YIELD, decay=PLANNER_DECAY,
+                 explore_budget=PLANNER_EXPLORE_BUDGET):
+        self.min_runs = min_runs
+        self.min_yield = min_yield
+        self.decay = decay
+        self.explore_budget = explore_budget
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        # This run's observations, merged into query_stats by flush()
+        self._observed = {}
+        self._failed = set()
+        self.skipped = []
+        self.explored = []
+
+    def stats(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT board, keyword, location, runs, listings, relevant, new, latency, last_run "
+                "FROM query_stats"
+            ).fetchall()
+        return {
+            tuple(row[:3]): dict(zip(("runs", *_FIELDS, "last_run"), row[3:]))
+            for row in rows
+        }
+
+    def plan(self, tasks):
+        """
+        Order tasks by expected yield and drop low-yield ones. Each task's
+        first element is its (board, keyword, location) key.
+        """
+        stats = self.stats()
+        run, low = [], []
+        for task in tasks:
+            s = stats.get(task[0])
+            if s is None or s["runs"] < self.min_runs or s["new"] >= self.min_yield:
+                run.append(task)
+            else:
+                low.append(task)
+
+        # Unknown queries first, then by yield per second of fetching
+        def rank(task):
+            s = stats.get(task[0])
+            if s is None:
+                return (0, 0.0)
+            return (1, -s["new"] / max(s["latency"], 0.1))
+
+        run.sort(key=rank)
+        low.sort(key=lambda task: stats[task[0]]["last_run"])
+        self.explored = low[:self.explore_budget]
+        self.skipped = low[self.explore_budget:]
+        return run + self.explored
+
+    def record(self, key, **values):
+        """Add to this run's counts for a query (listings, relevant, new, latency)."""
+        with self._lock:
+            if key in self._failed:
+                return
+            observed = self._observed.setdefault(key, dict.fromkeys(_FIELDS, 0))
+            for field, value in values.items():
+                observed[field] += value
+
+    def fail(self, key):
+        """Leave a query out of this run: its fetch failed, so its counts say nothing."""
+        with self._lock:
+            self._failed.add(key)
+            self._observed.pop(key, None)
+
+    def flush(self, now=None):
+        """Fold this run into the moving averages and forget long-unrun queries."""
+        now = time.time() if now is None else now
+        stats = self.stats()
+        rows = []
+        for key, observed in self._observed.items():
+            s = stats.get(key)
+            if s is None:
+                rows.append((*key, 1, *(observed[f] for f in _FIELDS), now))
+            else:
+                rows.append((*key, s["runs"] + 1, *(
+                    s[f] + self.decay * (observed[f] - s[f]) for f in _FIELDS
+                ), now))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO query_stats "
+                "(board, keyword, location, runs, listings, relevant, new, latency, last_run) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            # Queries no longer configured (or not run for this long) start over
+            self._conn.execute(
+                "DELETE FROM query_stats WHERE last_run < ?", (now - SEEN_JOBS_TTL_DAYS * 86400,)
+            )
+            self._observed.clear()
+            self._failed.clear()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,130 @@
+"""
+question_deck.py
+Shuffled-deck scheduling for the daily interview questions.
+
+Each category deals every question once, in a random order, before any
+repeats. The order is a seeded permutation of the category's question
+IDs, computed one position at a time with a small Feistel network, so a
+deck is just (seed, size, cursor): drawing is O(1) and the saved state
+stays a few numbers however large the bank grows. Questions added during
+a deck join the next one; deleted IDs are skipped.
+
+Flagged questions are dealt again on a spaced-repetition schedule, ahead
+of the deck, until they are unflagged.
+"""
+
+import hashlib
+import random
+from datetime import date, timedelta
+
+from config import QUESTION_REVIEW_FIRST_DAYS, QUESTION_REVIEW_MAX_DAYS
+
+_ROUNDS = 4
+
+
+# ============================================================
+# PERMUTATION
+# ============================================================
+
+def _round_key(seed, rnd, value):
+    digest = hashlib.blake2b(f"{seed}:{rnd}:{value}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def permute(index, size, seed):
+    """
+    Position index of a seeded permutation of range(size). A Feistel
+    network permutes the enclosing power-of-4 range; results outside
+    range(size) are fed back in (cycle walking), which takes fewer than
+    four passes on average.
+    """
+    half = max(1, ((size - 1).bit_length() + 1) // 2)
+    mask = (1 << half) - 1
+    value = index
+    while True:
+        left, right = value >> half, value & mask
+        for rnd in range(_ROUNDS):
+            left, right = right, left ^ (_round_key(seed, rnd, right) & mask)
+        value = (left << half) | right
+        if value < size:
+            return value
+
+
+# ============================================================
+# DECK
+# ============================================================
+
+class QuestionDeck:
+    """
+    One category's schedule. state is the dict kept in the state file and
+    is updated in place:
+      seed, size, cursor — the current deck (IDs 1..size)
+      skip               — IDs not to deal again this deck
+      review             — flagged ID -> {"due": ISO date, "interval": days}
+    """
+
+    def __init__(self, questions, state=None):
+        self.questions = questions
+        self.state = state if state is not None else {}
+        self.state.setdefault("seed", 0)
+        self.state.setdefault("size", 0)
+        self.state.setdefault("cursor", 0)
+        self.state.setdefault("review", {})
+
+    def _new_deck(self):
+        self.state.update(seed=random.getrandbits(32), size=max(self.questions, default=0), cursor=0)
+        self.state.pop("skip", None)
+
+    def _due_review(self, today):
+        due = [
+            (entry["due"], int(qid)) for qid, entry in self.state["review"].items()
+            if int(qid) in self.questions and entry["due"] <= today.isoformat()
+        ]
+        return min(due)[1] if due else None
+
+    def draw(self, today=None):
+        """The ID of the next question to send, or None if the bank is empty."""
+        if not self.questions:
+            return None
+        today = today or date.today()
+
+        qid = self._due_review(today)
+        if qid is not None:
+            entry = self.state["review"][str(qid)]
+            entry["interval"] = min(entry["interval"] * 2, QUESTION_REVIEW_MAX_DAYS)
+            entry["due"] = (today + timedelta(days=entry["interval"])).isoformat()
+            return qid
+
+        skip = set(self.state.get("skip", ()))
+        # At most one fresh deck per draw: the bank isn't empty, so it deals something
+        for _ in range(2):
+            while self.state["cursor"] < self.state["size"]:
+                qid = permute(self.state["cursor"], self.state["size"], self.state["seed"]) + 1
+                self.state["cursor"] += 1
+                if qid in self.questions and qid not in skip:
+                    return qid
+            self._new_deck()
+            skip = set()
+        return None
+
+    def flag(self, qid, today=None):
+        """Bring qid back QUESTION_REVIEW_FIRST_DAYS from today, then at growing intervals."""
+        if qid not in self.questions:
+            raise KeyError(qid)
+        due = (today or date.today()) + timedelta(days=QUESTION_REVIEW_FIRST_DAYS)
+        self.state["review"][str(qid)] = {"due": due.isoformat(), "interval": QUESTION_REVIEW_FIRST_DAYS}
+
+    def unflag(self, qid):
+        return self.state["review"].pop(str(qid), None) is not None
+
+
+def migrate(questions, seen_texts):
+    """
+    State for a category from the old format (a list of question texts
+    already sent this cycle): a fresh deck that skips those questions.
+    """
+    ids = {text: qid for qid, text in questions.items()}
+    deck = QuestionDeck(questions)
+    deck._new_deck()
+    deck.state["skip"] = sorted({ids[text] for text in seen_texts if text in ids})
+    return deck.state
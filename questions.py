@@ -1,93 +1,98 @@
 # Interview Questions Bank
 # Used by the daily interview prep sender
+#
+# Each question has a permanent ID within its category: the daily deck and
+# review schedule in seen_questions.json refer to questions by ID, so the
+# text can be edited freely. Never renumber or reuse an ID; a new question
+# takes the next unused number, and a retired one is simply deleted.
 
-TECHNICAL_QUESTIONS = [
+TECHNICAL_QUESTIONS = {
     # JavaScript / TypeScript
-    "What is the difference between `null` and `undefined` in JavaScript?",
-    "Explain event delegation in JavaScript and why it's useful.",
-    "What is the difference between `==` and `===` in JavaScript?",
-    "What are Promises and how do they differ from callbacks?",
-    "Explain `async/await` and how it works under the hood.",
-    "What is closure in JavaScript? Give a practical example.",
-    "What is the difference between `var`, `let`, and `const`?",
-    "Explain the JavaScript event loop.",
-    "What is TypeScript and what problem does it solve?",
-    "What are generics in TypeScript and when would you use them?",
+    1: "What is the difference between `null` and `undefined` in JavaScript?",
+    2: "Explain event delegation in JavaScript and why it's useful.",
+    3: "What is the difference between `==` and `===` in JavaScript?",
+    4: "What are Promises and how do they differ from callbacks?",
+    5: "Explain `async/await` and how it works under the hood.",
+    6: "What is closure in JavaScript? Give a practical example.",
+    7: "What is the difference between `var`, `let`, and `const`?",
+    8: "Explain the JavaScript event loop.",
+    9: "What is TypeScript and what problem does it solve?",
+    10: "What are generics in TypeScript and when would you use them?",
 
     # React / Next.js
-    "What is the difference between `useEffect` and `useLayoutEffect`?",
-    "Explain the React component lifecycle.",
-    "What is the difference between controlled and uncontrolled components?",
-    "When would you use `useCallback` vs `useMemo`?",
-    "What is the virtual DOM and how does React use it?",
-    "What is the difference between Server Side Rendering and Client Side Rendering?",
-    "What are React Server Components and how do they differ from Client Components?",
-    "Explain the difference between `getServerSideProps` and `getStaticProps` in Next.js.",
-    "What is hydration in Next.js?",
-    "How does Next.js App Router differ from Pages Router?",
+    11: "What is the difference between `useEffect` and `useLayoutEffect`?",
+    12: "Explain the React component lifecycle.",
+    13: "What is the difference between controlled and uncontrolled components?",
+    14: "When would you use `useCallback` vs `useMemo`?",
+    15: "What is the virtual DOM and how does React use it?",
+    16: "What is the difference between Server Side Rendering and Client Side Rendering?",
+    17: "What are React Server Components and how do they differ from Client Components?",
+    18: "Explain the difference between `getServerSideProps` and `getStaticProps` in Next.js.",
+    19: "What is hydration in Next.js?",
+    20: "How does Next.js App Router differ from Pages Router?",
 
     # Node.js / Express
-    "What is the Node.js event loop and how is it different from the browser's?",
-    "What is middleware in Express? Give an example.",
-    "How do you handle errors in Express?",
-    "What is the difference between `require` and `import` in Node.js?",
-    "What are streams in Node.js and when would you use them?",
-    "How would you prevent a Node.js server from crashing on unhandled errors?",
-    "What is CORS and how do you handle it in Express?",
-    "Explain JWT authentication — how does it work end to end?",
+    21: "What is the Node.js event loop and how is it different from the browser's?",
+    22: "What is middleware in Express? Give an example.",
+    23: "How do you handle errors in Express?",
+    24: "What is the difference between `require` and `import` in Node.js?",
+    25: "What are streams in Node.js and when would you use them?",
+    26: "How would you prevent a Node.js server from crashing on unhandled errors?",
+    27: "What is CORS and how do you handle it in Express?",
+    28: "Explain JWT authentication — how does it work end to end?",
 
     # Databases
-    "What is the difference between SQL and NoSQL databases?",
-    "Explain database indexing and why it matters.",
-    "What is an ORM? What are the pros and cons?",
-    "What is a database transaction and why is it important?",
-    "What is the N+1 query problem and how do you solve it in Prisma?",
-    "Explain the difference between `JOIN` types in SQL.",
-    "What is database normalization?",
-    "When would you use a relational database vs a document database?",
+    29: "What is the difference between SQL and NoSQL databases?",
+    30: "Explain database indexing and why it matters.",
+    31: "What is an ORM? What are the pros and cons?",
+    32: "What is a database transaction and why is it important?",
+    33: "What is the N+1 query problem and how do you solve it in Prisma?",
+    34: "Explain the difference between `JOIN` types in SQL.",
+    35: "What is database normalization?",
+    36: "When would you use a relational database vs a document database?",
 
     # System Design / General
-    "What is REST? What makes an API RESTful?",
-    "What is the difference between authentication and authorization?",
-    "Explain what happens when you type a URL into your browser.",
-    "What is a CDN and when would you use one?",
-    "What is caching? Where can you implement it in a web application?",
-    "What is rate limiting and why is it important?",
-    "Explain the difference between horizontal and vertical scaling.",
-    "What is a webhook? How is it different from polling?",
-    "What is CI/CD and why does it matter?",
-    "What is Docker and what problem does it solve?",
+    37: "What is REST? What makes an API RESTful?",
+    38: "What is the difference between authentication and authorization?",
+    39: "Explain what happens when you type a URL into your browser.",
+    40: "What is a CDN and when would you use one?",
+    41: "What is caching? Where can you implement it in a web application?",
+    42: "What is rate limiting and why is it important?",
+    43: "Explain the difference between horizontal and vertical scaling.",
+    44: "What is a webhook? How is it different from polling?",
+    45: "What is CI/CD and why does it matter?",
+    46: "What is Docker and what problem does it solve?",
 
     # Python / ML
-    "What is the difference between a list and a tuple in Python?",
-    "Explain Python decorators with an example.",
-    "What is the GIL in Python and why does it matter?",
-    "What is overfitting in machine learning and how do you prevent it?",
-    "Explain the difference between supervised and unsupervised learning.",
-    "What is a Random Forest and how does it work?",
-    "What is cross-validation and why is it used?",
-    "What is the difference between precision and recall?",
-]
+    47: "What is the difference between a list and a tuple in Python?",
+    48: "Explain Python decorators with an example.",
+    49: "What is the GIL in Python and why does it matter?",
+    50: "What is overfitting in machine learning and how do you prevent it?",
+    51: "Explain the difference between supervised and unsupervised learning.",
+    52: "What is a Random Forest and how does it work?",
+    53: "What is cross-validation and why is it used?",
+    54: "What is the difference between precision and recall?",
+}
 
-BEHAVIOURAL_QUESTIONS = [
-    "Tell me about yourself. (Keep it under 2 minutes — focus on projects and skills, not your life story.)",
-    "Why do you want to work here?",
-    "What is your greatest technical achievement so far?",
-    "Describe a time you had to learn something new quickly. How did you approach it?",
-    "Tell me about a project where something went wrong. How did you handle it?",
-    "How do you prioritize tasks when you have multiple deadlines?",
-    "Describe your experience working in a team. What was your role?",
-    "What do you do when you're stuck on a problem for a long time?",
-    "Where do you see yourself in 3 years?",
-    "Why did you choose software engineering?",
-    "What side projects are you currently working on?",
-    "How do you stay up to date with new technologies?",
-    "Describe a time you disagreed with a teammate. How did you resolve it?",
-    "What is your biggest weakness as a developer?",
-    "Why are you looking for a job now?",
-    "What kind of work environment do you thrive in?",
-    "Tell me about a time you took initiative on a project.",
-    "How do you handle feedback and code reviews?",
-    "What motivates you to write good code?",
-    "Do you prefer working on frontend, backend, or full stack? Why?",
-]
\ No newline at end of file
+BEHAVIOURAL_QUESTIONS = {
+    1: "Tell me about yourself. (Keep it under 2 minutes — focus on projects and skills, not your life story.)",
+    2: "Why do you want to work here?",
+    3: "What is your greatest technical achievement so far?",
+    4: "Describe a time you had to learn something new quickly. How did you approach it?",
+    5: "Tell me about a project where something went wrong. How did you handle it?",
+    6: "How do you prioritize tasks when you have multiple deadlines?",
+    7: "Describe your experience working in a team. What was your role?",
+    8: "What do you do when you're stuck on a problem for a long time?",
+    9: "Where do you see yourself in 3 years?",
+    10: "Why did you choose software engineering?",
+    11: "What side projects are you currently working on?",
+    12: "How do you stay up to date with new technologies?",
+    13: "Describe a time you disagreed with a teammate. How did you resolve it?",
+    14: "What is your biggest weakness as a developer?",
+    15: "Why are you looking for a job now?",
+    16: "What kind of work environment do you thrive in?",
+    17: "Tell me about a time you took initiative on a project.",
+    18: "How do you handle feedback and code reviews?",
+    19: "What motivates you to write good code?",
+    20: "Do you prefer working on frontend, backend, or full stack? Why?",
+}
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+response_cache.py
+Persistent cache of search-page responses, kept between scraper runs.
+
+For each URL it stores the validators (ETag / Last-Modified), a hash of
+the last body, and the listings that were extracted from it. The scraper
+sends conditional requests, and when the server answers 304 or returns a
+byte-identical body the cached listings are reused without parsing.
+Entries expire after a TTL and the file is kept bounded by LRU eviction.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from config import (
+    RESPONSE_CACHE_FILE, RESPONSE_CACHE_TTL_HOURS,
+    RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_MAX_BYTES,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    body_hash     TEXT NOT NULL,
+    listings      TEXT NOT NULL,
+    size          INTEGER NOT NULL,
+    stored_at     REAL NOT NULL,
+    last_access   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+"""
+
+
+class ResponseCache:
+    def __init__(self, path=RESPONSE_CACHE_FILE, ttl_hours=RESPONSE_CACHE_TTL_HOURS,
+                 max_entries=RESPONSE_CACHE_MAX_ENTRIES, max_bytes=RESPONSE_CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def _db(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def lookup(self, url):
+        """Return the cached entry for url, or None if missing or older than the TTL."""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT etag, last_modified, body_hash, listings FROM responses "
+                "WHERE url = ? AND stored_at >= ?",
+                (url, time.time() - self.ttl),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, body_hash, listings = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": body_hash,
+            "listings": json.loads(listings),
+        }
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def hit(self, url):
+        """Record that the cached listings for url were reused."""
+        with self._lock:
+            self.hits += 1
+            self._db().execute(
+                "UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url)
+            )
+            self._db().commit()
+
+    def store(self, url, response, body_hash, listings):
+        payload = json.dumps(listings, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self.misses += 1
+            self._db().execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, body_hash, listings, size, stored_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    body_hash,
+                    payload,
+                    len(payload.encode("utf-8")),
+                    now,
+                    now,
+                ),
+            )
+            self._db().commit()
+
+    def prune(self):
+        """Drop expired entries, then least-recently-used ones until under both limits."""
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl,))
+            count, total = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            if count > self.max_entries or total > self.max_bytes:
+                evict = []
+                for url, size in db.execute(
+                    "SELECT url, size FROM responses ORDER BY last_access ASC"
+                ):
+                    if count <= self.max_entries and total <= self.max_bytes:
+                        break
+                    evict.append((url,))
+                    count -= 1
+                    total -= size
+                db.executemany("DELETE FROM responses WHERE url = ?", evict)
+            db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,95 @@
+"""
+scheduler.py
+Runs the scraper, the daily question and the weekly summary inside bot.py.
+
+Each one is a job on the bot's JobQueue at its UAE-time slot. The script's
+main() runs in a worker thread so the bot keeps answering commands, and
+because the process stays up, module-level state carries over between
+runs: pooled HTTP sessions and the response cache stay open instead of
+being rebuilt by a fresh interpreter every time. The per-run SQLite
+stores (seen jobs, watermarks, planner, near-duplicates) are still opened
+and closed by each run. A job that fires while its previous run is still
+going is skipped.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import warnings
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from telegram.warnings import PTBUserWarning
+
+from config import (
+    SCHEDULE_TIMEZONE, SCRAPE_TIMES, QUESTION_TIME, SUMMARY_TIME, SUMMARY_DAYS,
+)
+
+logger = logging.getLogger(__name__)
+
+_EVERY_DAY = tuple(range(7))
+
+
+def _scrape():
+    import scraper
+    scraper.main()
+
+
+def _question():
+    import daily_question
+    daily_question.main()
+
+
+def _summary():
+    import weekly_summary
+    weekly_summary.main()
+
+
+# Job name -> (function, times, days)
+JOBS = {
+    "scraper": (_scrape, SCRAPE_TIMES, _EVERY_DAY),
+    "daily_question": (_question, (QUESTION_TIME,), _EVERY_DAY),
+    "weekly_summary": (_summary, (SUMMARY_TIME,), SUMMARY_DAYS),
+}
+
+_running = {name: threading.Lock() for name in JOBS}
+
+
+async def run_job(name):
+    """Run one job now in a worker thread. Returns False if it was already running."""
+    lock = _running[name]
+    if not lock.acquire(blocking=False):
+        print(f"[Scheduler] {name} is still running — skipping this slot")
+        return False
+    started = time.perf_counter()
+    try:
+        await asyncio.to_thread(JOBS[name][0])
+        print(f"[Scheduler] {name} finished in {time.perf_counter() - started:.1f}s")
+    except Exception:
+        # A failed run is logged and the next slot tries again
+        logger.exception("Scheduled job %s failed", name)
+    finally:
+        lock.release()
+    return True
+
+
+async def _callback(context):
+    await run_job(context.job.data)
+
+
+def _at(hhmm, tz):
+    return datetime.strptime(hhmm, "%H:%M").time().replace(tzinfo=tz)
+
+
+def schedule_jobs(app):
+    """Register every job on app's JobQueue."""
+    tz = ZoneInfo(SCHEDULE_TIMEZONE)
+    # days already uses the v20 numbering (0 = Sunday); skip PTB's reminder
+    warnings.filterwarnings("ignore", message="Prior to v20.0 the `days`", category=PTBUserWarning)
+    for name, (_, times, days) in JOBS.items():
+        for hhmm in times:
+            app.job_queue.run_daily(
+                _callback, _at(hhmm, tz), days=days, data=name, name=f"{name}@{hhmm}",
+            )
+        print(f"[Scheduler] {name} at {', '.join(times)} {SCHEDULE_TIMEZONE}")
@@ -0,0 +1,131 @@
+"""
+scoring.py
+Relevance scoring for job listings.
+
+The keyword tables in config.py are compiled once into a single trie-shaped
+regex, so a title or a full job description is scored in one pass over the
+text instead of one substring search per keyword.
+
+Titles are matched on plain substrings against every table. Descriptions
+are matched on whole words, and only against the boost and penalty weights
+and the phrase-level rejections in DESCRIPTION_REJECTION_KEYWORDS: a word
+like "sales" rejects a title but not "partner with our sales team".
+"""
+
+import re
+from collections import namedtuple
+
+from config import (
+    REJECTION_KEYWORDS, DESCRIPTION_REJECTION_KEYWORDS,
+    SCORE_BOOST_KEYWORDS, SCORE_PENALTY_KEYWORDS,
+)
+
+REJECTED_SCORE = -99
+
+ScoreResult = namedtuple("ScoreResult", ["score", "matched"])
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def _trie_pattern(node, words=False, last=None):
+    """
+    Regex for a trie node; longer continuations are tried before stopping.
+    With words=True a keyword ending in a word character must not run on
+    into another one; last is the character that led to this node.
+    """
+    branches = [re.escape(ch) + _trie_pattern(child, words, ch)
+                for ch, child in sorted(node.items()) if ch != ""]
+    stop = r"(?!\w)" if words and last is not None and _is_word(last) else ""
+    if not branches:
+        return stop
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return "(?:" + body + "|" + stop + ")" if stop else "(?:" + body + ")?"
+    return body
+
+
+class KeywordScorer:
+    """
+    Scores text against rejection, boost and penalty keyword tables.
+
+    A keyword counts once if it appears anywhere in the text, as a
+    case-insensitive substring, which matches the plain `in` checks this
+    replaces; with words=True it must also stand as whole words. The regex
+    reports the longest keyword starting at each position; every shorter
+    keyword that is a prefix of it also matches there, so those are added
+    from a precomputed table.
+    """
+
+    def __init__(self, rejections, boosts, penalties, words=False):
+        self.rejections = {k.lower() for k in rejections if k}
+        self.weights = {}
+        for keyword, weight in list(boosts) + list(penalties):
+            keyword = keyword.lower()
+            if not keyword:
+                continue
+            self.weights[keyword] = self.weights.get(keyword, 0) + weight
+
+        keywords = self.rejections | set(self.weights)
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        # The leading character class lets the engine skip positions that
+        # cannot start any keyword before entering the trie; with words=True
+        # so does the start-of-word check, unless the keyword starts with
+        # a non-word character and needs none.
+        first_chars = re.escape("".join(sorted({k[0] for k in keywords})))
+        start = r"(?:(?<!\w)|(?=\W))" if words else ""
+        self._regex = re.compile(
+            "(?=[" + first_chars + "])" + start + "(?=(" + _trie_pattern(trie, words) + "))"
+        ) if keywords else None
+        # A shorter keyword only matches as whole words if it ends at a
+        # boundary inside the longer one
+        self._prefixes = {
+            keyword: tuple(
+                k for k in keywords if keyword.startswith(k) and (
+                    not words or len(k) == len(keyword)
+                    or not (_is_word(k[-1]) and _is_word(keyword[len(k)]))
+                )
+            )
+            for keyword in keywords
+        }
+
+    def matches(self, text):
+        """All keywords found in text."""
+        if self._regex is None:
+            return set()
+        found = set()
+        for longest in set(self._regex.findall(text.lower())):
+            found.update(self._prefixes[longest])
+        return found
+
+    def score(self, text):
+        return self.result(self.matches(text))
+
+    def result(self, found):
+        """ScoreResult for a set of matched keywords."""
+        rejected = found & self.rejections
+        if rejected:
+            return ScoreResult(REJECTED_SCORE, tuple(sorted(rejected)))
+        matched = tuple(sorted(k for k in found if k in self.weights))
+        return ScoreResult(sum(self.weights[k] for k in matched), matched)
+
+
+SCORER = KeywordScorer(REJECTION_KEYWORDS, SCORE_BOOST_KEYWORDS, SCORE_PENALTY_KEYWORDS)
+DESCRIPTION_SCORER = KeywordScorer(
+    DESCRIPTION_REJECTION_KEYWORDS, SCORE_BOOST_KEYWORDS, SCORE_PENALTY_KEYWORDS, words=True,
+)
+
+
+def score_text(title, description=""):
+    """Score a title, plus its description if there is one; each keyword counts once."""
+    found = SCORER.matches(f"{title} ")
+    if description:
+        found |= DESCRIPTION_SCORER.matches(description)
+    return SCORER.result(found)
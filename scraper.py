@@ -1,19 +1,29 @@
 import os
-import requests
-import json
-import time
 import hashlib
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import ExitStack
 from datetime import datetime
-from bs4 import BeautifulSoup
-from dotenv import load_dotenv
-
-load_dotenv()
-
+from env import load_env
+
+load_env()
+
+import transport
+from boards import BOARDS, extract_listings
+from dedup import NearDuplicateIndex
+from enrichment import Enricher
+from metrics import METRICS
+from planner import QueryPlanner
+from response_cache import ResponseCache
+from scoring import score_text
+from seen_store import SeenJobsStore, QueryWatermarks
+from telegram_sender import shared_sender
 from config import (
     SEARCH_KEYWORDS, LOCATIONS,
-    SCORE_BOOST_KEYWORDS, SCORE_PENALTY_KEYWORDS,
-    REJECTION_KEYWORDS, SEEN_JOBS_FILE, MAX_JOBS_PER_MESSAGE,
-    TELEGRAM_MAX_CHARS, TELEGRAM_SEND_DELAY_SEC, MIN_SCORE,
+    SEEN_JOBS_FILE, MAX_JOBS_PER_MESSAGE, DEDUP_ENABLED, ENRICH_DESCRIPTIONS, PLANNER_ENABLED,
+    TELEGRAM_MAX_CHARS, MIN_SCORE, MAX_PAGES_PER_QUERY, WATERMARK_SIZE,
+    METRICS_JSON_FILE, METRICS_PROM_FILE,
     TELEGRAM_BOT_TOKEN as _CONFIG_TOKEN,
     TELEGRAM_CHAT_ID as _CONFIG_CHAT_ID,
 )
@@ -28,23 +38,14 @@ HEADERS = {
     "Referer": "https://www.google.com/",
 }
 
+CACHE = ResponseCache()
+SENDER = shared_sender(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID)
+
 
 # ============================================================
 # SEEN JOBS TRACKER
 # ============================================================
 
-def load_seen_jobs():
-    if os.path.exists(SEEN_JOBS_FILE):
-        with open(SEEN_JOBS_FILE, "r", encoding="utf-8") as f:
-            return set(json.load(f))
-    return set()
-
-
-def save_seen_jobs(seen):
-    with open(SEEN_JOBS_FILE, "w", encoding="utf-8") as f:
-        json.dump(list(seen), f)
-
-
 def make_job_id(title, company):
     raw = f"{title.lower().strip()}{company.lower().strip()}"
     return hashlib.md5(raw.encode()).hexdigest()
@@ -55,23 +56,7 @@ def make_job_id(title, company):
 # ============================================================
 
 def score_job(title, description=""):
-    text = f"{title} {description}".lower()
-
-    for keyword in REJECTION_KEYWORDS:
-        if keyword.lower() in text:
-            return -99
-
-    score = 0
-
-    for keyword, boost in SCORE_BOOST_KEYWORDS:
-        if keyword.lower() in text:
-            score += boost
-
-    for keyword, penalty in SCORE_PENALTY_KEYWORDS:
-        if keyword.lower() in text:
-            score += penalty
-
-    return score
+    return score_text(title, description).score
 
 
 def is_relevant(title, description=""):
@@ -79,274 +64,137 @@ def is_relevant(title, description=""):
 
 
 # ============================================================
-# LINKEDIN SCRAPER — removed experience filter to catch more roles
-# ============================================================
-
-def scrape_linkedin(keyword, location="United Arab Emirates"):
-    jobs = []
-    query = keyword.replace(" ", "%20")
-    loc = location.replace(" ", "%20")
-    # Removed f_E=1%2C2 (entry level filter) — catches more junior roles
-    url = (
-        f"https://www.linkedin.com/jobs/search/"
-        f"?keywords={query}&location={loc}&f_TPR=r86400"
-    )
-
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        if response.status_code != 200:
-            print(f"  [LinkedIn] Failed '{keyword}' in {location} — {response.status_code}")
-            return jobs
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        listings = soup.find_all("div", {"class": "base-card"})
-
-        for listing in listings[:20]:
-            try:
-                title_tag = listing.find("h3", {"class": "base-search-card__title"})
-                company_tag = listing.find("h4", {"class": "base-search-card__subtitle"})
-                location_tag = listing.find("span", {"class": "job-search-card__location"})
-                link_tag = listing.find("a", {"class": "base-card__full-link"})
-
-                if not title_tag or not link_tag:
-                    continue
-
-                title = title_tag.get_text(strip=True)
-                company = company_tag.get_text(strip=True) if company_tag else "Unknown"
-                loc_text = location_tag.get_text(strip=True) if location_tag else location
-                link = link_tag["href"].split("?")[0]
-
-                if is_relevant(title):
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": loc_text,
-                        "url": link,
-                        "source": "LinkedIn",
-                        "score": score_job(title),
-                        "id": make_job_id(title, company)
-                    })
-
-            except Exception:
-                continue
-
-    except Exception as e:
-        print(f"  [LinkedIn] Error: {e}")
-
-    return jobs
-
-
-# ============================================================
-# BAYT SCRAPER
-# ============================================================
-
-def scrape_bayt(keyword):
-    jobs = []
-    query = keyword.strip().lower().replace(" ", "-")
-    url = f"https://www.bayt.com/en/uae/jobs/{query}-jobs/"
-
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        if response.status_code != 200:
-            print(f"  [Bayt] Failed '{keyword}' — {response.status_code}")
-            return jobs
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        listings = soup.find_all("li", {"class": lambda c: c and "has-pointer-d" in c})
-
-        for listing in listings[:20]:
-            try:
-                title_tag = listing.find("h2", {"class": "m0 t-regular"})
-                company_tag = listing.find("b", {"class": "t-default"})
-                location_tag = listing.find("span", {"class": "t-mute"})
-                link_tag = listing.find("a", href=True)
-
-                if not title_tag or not link_tag:
-                    continue
-
-                title = title_tag.get_text(strip=True)
-                company = company_tag.get_text(strip=True) if company_tag else "Unknown"
-                location = location_tag.get_text(strip=True) if location_tag else "UAE"
-                link = "https://www.bayt.com" + link_tag["href"] if link_tag["href"].startswith("/") else link_tag["href"]
-
-                if is_relevant(title):
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "url": link,
-                        "source": "Bayt",
-                        "score": score_job(title),
-                        "id": make_job_id(title, company)
-                    })
-
-            except Exception:
-                continue
-
-    except Exception as e:
-        print(f"  [Bayt] Error: {e}")
-
-    return jobs
-
-
-# ============================================================
-# GULFTALEN SCRAPER
-# ============================================================
-
-def scrape_gulftalen(keyword):
-    jobs = []
-    query = keyword.replace(" ", "+")
-    url = f"https://www.gulftalent.com/uae/jobs/search/?search_text={query}"
-
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        if response.status_code != 200:
-            print(f"  [GulfTalent] Failed '{keyword}' — {response.status_code}")
-            return jobs
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        listings = soup.find_all("div", {"class": "job-item"})
-
-        for listing in listings[:20]:
-            try:
-                title_tag = listing.find("h3")
-                company_tag = listing.find("span", {"class": "company"})
-                location_tag = listing.find("span", {"class": "location"})
-                link_tag = listing.find("a", href=True)
-
-                if not title_tag or not link_tag:
-                    continue
-
-                title = title_tag.get_text(strip=True)
-                company = company_tag.get_text(strip=True) if company_tag else "Unknown"
-                location = location_tag.get_text(strip=True) if location_tag else "UAE"
-                href = link_tag["href"]
-                link = "https://www.gulftalen.com" + href if href.startswith("/") else href
-
-                if is_relevant(title):
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "url": link,
-                        "source": "GulfTalent",
-                        "score": score_job(title),
-                        "id": make_job_id(title, company)
-                    })
-
-            except Exception:
-                continue
-
-    except Exception as e:
-        print(f"  [GulfTalent] Error: {e}")
-
-    return jobs
-
-
-# ============================================================
-# DUBIZZLE SCRAPER
+# SEARCH — fetch, extract and score one board's results page
 # ============================================================
 
-def scrape_dubizzle(keyword):
+def fetch_listings(source, url, what, parse):
+    """
+    Fetch a search page and return the raw listings parse() extracts from it,
+    or None if the request failed. Pages the server reports as unchanged (304)
+    or whose body hashes the same as last run are served from the response
+    cache without being parsed again.
+    """
+    entry = CACHE.lookup(url)
+    headers = {**HEADERS, **CACHE.conditional_headers(entry)}
+
+    response = transport.get(url, headers=headers, timeout=15)
+    if response.status_code == 304 and entry:
+        CACHE.hit(url)
+        METRICS.inc("pages", source=source, result="not_modified")
+        return entry["listings"]
+    if response.status_code != 200:
+        print(f"  [{source}] Failed {what} — {response.status_code}")
+        METRICS.inc("pages", source=source, result="failed")
+        return None
+
+    body_hash = hashlib.sha256(response.content).hexdigest()
+    if entry and entry["body_hash"] == body_hash:
+        CACHE.hit(url)
+        METRICS.inc("pages", source=source, result="unchanged")
+        return entry["listings"]
+
+    with METRICS.timer("parse", source):
+        listings = parse(response.text)
+    CACHE.store(url, response, body_hash, listings)
+    METRICS.inc("pages", source=source, result="parsed")
+    if not listings:
+        METRICS.inc("empty_pages", source=source)
+    return listings
+
+
+def build_jobs(listings, source):
     jobs = []
-    query = keyword.replace(" ", "%20")
-    url = f"https://uae.dubizzle.com/jobs/?search={query}"
-
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        if response.status_code != 200:
-            print(f"  [Dubizzle] Failed '{keyword}' — {response.status_code}")
-            return jobs
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        listings = soup.find_all("article")
-
-        for listing in listings[:20]:
-            try:
-                title_tag = listing.find("h2") or listing.find("h3")
-                company_tag = listing.find("span", {"class": lambda c: c and "company" in str(c).lower()})
-                location_tag = listing.find("span", {"class": lambda c: c and "location" in str(c).lower()})
-                link_tag = listing.find("a", href=True)
-
-                if not title_tag or not link_tag:
-                    continue
-
-                title = title_tag.get_text(strip=True)
-                company = company_tag.get_text(strip=True) if company_tag else "Unknown"
-                location = location_tag.get_text(strip=True) if location_tag else "UAE"
-                href = link_tag["href"]
-                link = "https://uae.dubizzle.com" + href if href.startswith("/") else href
-
-                if is_relevant(title):
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "url": link,
-                        "source": "Dubizzle",
-                        "score": score_job(title),
-                        "id": make_job_id(title, company)
-                    })
-
-            except Exception:
-                continue
-
-    except Exception as e:
-        print(f"  [Dubizzle] Error: {e}")
-
+    with METRICS.timer("score", source):
+        for listing in listings:
+            title = listing["title"]
+            score = score_job(title)
+            if score >= MIN_SCORE:
+                jobs.append({
+                    "title": title,
+                    "company": listing["company"],
+                    "location": listing["location"],
+                    "url": listing["url"],
+                    "source": source,
+                    "score": score,
+                    "id": make_job_id(title, listing["company"])
+                })
+    METRICS.inc("listings", len(listings), source=source)
+    METRICS.inc("rejected", len(listings) - len(jobs), source=source, stage="title")
     return jobs
 
 
-# ============================================================
-# WUZZUF SCRAPER
-# ============================================================
-
-def scrape_wuzzuf(keyword):
+def scrape_board(board, keyword, location=None, seen_jobs=None, watermarks=None, planner=None):
+    """
+    Walk a query's result pages newest-first and return its relevant jobs.
+    Paging stops at the first empty page, the first page that reaches last
+    run's watermark (the IDs that topped page one then), or the first whose
+    relevant jobs were all sent before. A query with no watermark yet reads
+    page one only, so the first run doesn't crawl deep into history.
+    Returns None if the board's circuit is open and the query wasn't run.
+    """
+    if transport.BREAKER.is_open(board.host):
+        return None
+
+    what = f"'{keyword}' in {location}" if location else f"'{keyword}'"
+    key = (board.name, keyword, location or "")
+    watermark = watermarks.get(board.name, keyword, location) if watermarks else None
+    max_pages = MAX_PAGES_PER_QUERY if board.page_param and watermark else 1
     jobs = []
-    query = keyword.replace(" ", "+")
-    url = f"https://wuzzuf.net/search/jobs/?q={query}&a=hpb"
+    listing_count = 0
+    failed = False
+    started = time.monotonic()
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        if response.status_code != 200:
-            print(f"  [Wuzzuf] Failed '{keyword}' — {response.status_code}")
-            return jobs
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        listings = soup.find_all("div", {"class": "css-1gatmva"})
-
-        for listing in listings[:20]:
-            try:
-                title_tag = listing.find("h2", {"class": "css-m604qf"})
-                company_tag = listing.find("a", {"class": "css-17s97q8"})
-                location_tag = listing.find("span", {"class": "css-5wys0k"})
-                link_tag = title_tag.find("a") if title_tag else None
-
-                if not title_tag or not link_tag:
-                    continue
-
-                title = title_tag.get_text(strip=True)
-                company = company_tag.get_text(strip=True) if company_tag else "Unknown"
-                loc_text = location_tag.get_text(strip=True) if location_tag else "UAE"
-                link = "https://wuzzuf.net" + link_tag["href"] if link_tag["href"].startswith("/") else link_tag["href"]
-
-                if is_relevant(title):
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": loc_text,
-                        "url": link,
-                        "source": "Wuzzuf",
-                        "score": score_job(title),
-                        "id": make_job_id(title, company)
-                    })
-
-            except Exception:
-                continue
-
+        for page in range(1, max_pages + 1):
+            url = board.build_url(keyword, location, page)
+            listings = fetch_listings(
+                board.name, url,
+                what if page == 1 else f"{what} page {page}",
+                lambda html: extract_listings(board, html, location),
+            )
+            if listings is None:
+                failed = True
+                break
+            # Only page one counts toward the empty-results circuit: later
+            # pages run out as a matter of course
+            if page == 1:
+                transport.BREAKER.record_listings(url, len(listings))
+            if not listings:
+                break
+            listing_count += len(listings)
+
+            listing_ids = [make_job_id(l["title"], l["company"]) for l in listings]
+            if page == 1 and watermarks is not None:
+                watermarks.set(board.name, keyword, location, listing_ids[:WATERMARK_SIZE])
+
+            page_jobs = build_jobs(listings, board.name)
+            jobs.extend(page_jobs)
+
+            if watermark and watermark.intersection(listing_ids):
+                break
+            if seen_jobs is not None and page_jobs and \
+                    len(seen_jobs.seen_among(job["id"] for job in page_jobs)) == len(page_jobs):
+                break
+    except transport.CircuitOpenError:
+        # The circuit opened while this query waited for its turn
+        if not listing_count:
+            if planner is not None:
+                planner.fail(key)
+            return None
+        failed = True
     except Exception as e:
-        print(f"  [Wuzzuf] Error: {e}")
-
+        print(f"  [{board.name}] Error: {e}")
+        failed = True
+
+    latency = time.monotonic() - started
+    METRICS.record("search", board.name, latency)
+    if planner is not None:
+        # A failed fetch isn't a zero-yield run; only successful ones
+        # move the query's averages
+        if failed:
+            planner.fail(key)
+        else:
+            planner.record(key, listings=listing_count, latency=latency)
     return jobs
 
 
@@ -355,19 +203,7 @@ def scrape_wuzzuf(keyword):
 # ============================================================
 
 def send_telegram_message(text):
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": text,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": True,
-    }
-    try:
-        response = requests.post(url, json=payload, timeout=10)
-        if response.status_code != 200:
-            print(f"[Telegram] Failed: {response.text}")
-    except Exception as e:
-        print(f"[Telegram] Error: {e}")
+    SENDER.deliver([text])
 
 
 def send_jobs_in_chunks(jobs, total_new):
@@ -378,6 +214,7 @@ def send_jobs_in_chunks(jobs, total_new):
         f"{'─' * 30}\n\n"
     )
 
+    messages = []
     current_message = header
 
     for job in jobs:
@@ -390,8 +227,7 @@ def send_jobs_in_chunks(jobs, total_new):
         )
 
         if len(current_message) + len(job_text) > TELEGRAM_MAX_CHARS:
-            send_telegram_message(current_message)
-            time.sleep(TELEGRAM_SEND_DELAY_SEC)
+            messages.append(current_message)
             current_message = (
                 "🚀 <b>Job Alert (continued)</b>\n"
                 f"{'─' * 30}\n\n"
@@ -400,7 +236,8 @@ def send_jobs_in_chunks(jobs, total_new):
         current_message += job_text
 
     current_message += "\n💪 Good luck Abdul Rahman!"
-    send_telegram_message(current_message)
+    messages.append(current_message)
+    SENDER.deliver(messages)
 
 
 def send_no_jobs_message():
@@ -416,71 +253,206 @@ def send_no_jobs_message():
 # MAIN
 # ============================================================
 
+def build_search_tasks(seen_jobs=None, watermarks=None, planner=None):
+    """
+    One task per (keyword, location, board) query. The first element of each
+    task is its (board, keyword, location) key in the planner's stats.
+    """
+    tasks = []
+    for keyword in SEARCH_KEYWORDS:
+        for board in BOARDS:
+            locations = LOCATIONS if board.per_location else [None]
+            for location in locations:
+                label = f"[{board.name}] '{keyword}' in {location}" if location else f"[{board.name}] '{keyword}'"
+                tasks.append(((board.name, keyword, location or ""), label, board.host, scrape_board,
+                              (board, keyword, location, seen_jobs, watermarks, planner)))
+    return tasks
+
+
+def run_searches(tasks):
+    """
+    Run every search concurrently and yield (task, jobs) as each finishes.
+    Each host gets its own worker pool sized to its concurrency cap, so a
+    slow board never holds up requests to the others; transport.LIMITER
+    enforces the minimum gap between requests to the same host. Finished
+    results are handed over and dropped straight away rather than held
+    until the tasks before them complete.
+    """
+    hosts = {host for _, _, host, _, _ in tasks}
+    executors = {
+        host: ThreadPoolExecutor(
+            max_workers=transport.LIMITER.concurrency(host),
+            thread_name_prefix=host,
+        )
+        for host in hosts
+    }
+    try:
+        pending = {executors[task[2]].submit(task[3], *task[4]): task for task in tasks}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        for executor in executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def stream_new_jobs(tasks, seen_jobs, new_ids, resurfaced, duplicates, near_dups=None,
+                    planner=None):
+    """
+    Yield each job not sent before, deduplicated on the fly.
+    new_ids collects the IDs yielded; resurfaced collects already-sent jobs
+    that are still listed, so their last_seen can be refreshed; duplicates
+    collects jobs the near-duplicate index matched to another posting.
+    Each query's relevant and new counts go to the planner, which ignores
+    them for queries scrape_board reported as failed.
+    """
+    for (key, label, _, _, _), jobs in run_searches(tasks):
+        if jobs is None:
+            print(f"  {label} — skipped, host circuit open")
+            METRICS.inc("queries_skipped", source=key[0])
+            continue
+        print(f"  {label} — {len(jobs)} listings")
+        new_before = len(new_ids)
+        already_seen = seen_jobs.seen_among(job["id"] for job in jobs)
+        resurfaced.update(already_seen)
+        for job in jobs:
+            job_id = job["id"]
+            if job_id in already_seen or job_id in new_ids or job_id in duplicates:
+                continue
+            if near_dups is not None:
+                with METRICS.timer("dedup", job["source"]):
+                    duplicate = near_dups.find_duplicate(job)
+                    if duplicate is None:
+                        near_dups.add(job)
+                if duplicate is not None:
+                    duplicates.add(job_id)
+                    METRICS.inc("duplicates", source=job["source"])
+                    continue
+            new_ids.add(job_id)
+            yield job
+        if planner is not None:
+            planner.record(key, relevant=len(jobs), new=len(new_ids) - new_before)
+
+
+class TopJobs:
+    """
+    The k highest-scoring jobs pushed so far, kept in a bounded min-heap.
+    Ties keep the earlier job, matching a stable sort of the full list.
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self._heap = []
+        self._count = 0
+
+    def push(self, job):
+        entry = (job.get("score", 0), -self._count, job)
+        self._count += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def best(self):
+        return [job for _, _, job in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
 def main():
     print(f"\n{'='*50}")
     print(f"Job Scraper Started — {datetime.now().strftime('%d %b %Y %H:%M')}")
     print(f"{'='*50}\n")
 
-    seen_jobs = load_seen_jobs()
-    all_jobs = []
-    seen_ids = set()
+    # Per-run counters and circuits start fresh when the scheduler in
+    # bot.py runs this again in the same process
+    METRICS.reset()
+    transport.BREAKER.reset()
+    CACHE.reset_stats()
+    SENDER.reset_stats()
+    transport.SESSIONS.reset_stats()
+
+    # The stores hold SQLite connections; when the scheduler runs this
+    # inside bot.py they must be closed even if the run fails
+    with ExitStack() as stores:
+        seen_jobs = SeenJobsStore()
+        stores.callback(seen_jobs.close)
+        migrated = seen_jobs.migrate_json()
+        if migrated:
+            print(f"[Seen] Imported {migrated} job IDs from {SEEN_JOBS_FILE}\n")
+
+        watermarks = QueryWatermarks()
+        stores.callback(watermarks.close)
+        planner = QueryPlanner() if PLANNER_ENABLED else None
+        if planner is not None:
+            stores.callback(planner.close)
+        near_dups = NearDuplicateIndex() if DEDUP_ENABLED else None
+        if near_dups is not None:
+            stores.callback(near_dups.close)
+        enricher = Enricher(HEADERS) if ENRICH_DESCRIPTIONS else None
+        if enricher is not None:
+            stores.callback(enricher.close)
+
+        new_ids = set()
+        resurfaced = set()
+        duplicates = set()
+        top_jobs = TopJobs(MAX_JOBS_PER_MESSAGE * 2)
+
+        tasks = build_search_tasks(seen_jobs, watermarks, planner)
+        if planner is not None:
+            tasks = planner.plan(tasks)
+            print(
+                f"[Planner] {len(tasks)} queries planned, {len(planner.skipped)} skipped as low-yield, "
+                f"{len(planner.explored)} rechecked\n"
+            )
 
-    for keyword in SEARCH_KEYWORDS:
-        print(f"Searching: '{keyword}'...")
-
-        for location in LOCATIONS:
-            linkedin_jobs = scrape_linkedin(keyword, location)
-            print(f"  [LinkedIn] '{location}' — {len(linkedin_jobs)} listings")
-            for job in linkedin_jobs:
-                if job["id"] not in seen_jobs and job["id"] not in seen_ids:
-                    all_jobs.append(job)
-                    seen_ids.add(job["id"])
-            time.sleep(3)
-
-        bayt_jobs = scrape_bayt(keyword)
-        print(f"  [Bayt] Found {len(bayt_jobs)} listings")
-        for job in bayt_jobs:
-            if job["id"] not in seen_jobs and job["id"] not in seen_ids:
-                all_jobs.append(job)
-                seen_ids.add(job["id"])
-
-        gulftalen_jobs = scrape_gulftalen(keyword)
-        print(f"  [GulfTalent] Found {len(gulftalen_jobs)} listings")
-        for job in gulftalen_jobs:
-            if job["id"] not in seen_jobs and job["id"] not in seen_ids:
-                all_jobs.append(job)
-                seen_ids.add(job["id"])
-
-        dubizzle_jobs = scrape_dubizzle(keyword)
-        print(f"  [Dubizzle] Found {len(dubizzle_jobs)} listings")
-        for job in dubizzle_jobs:
-            if job["id"] not in seen_jobs and job["id"] not in seen_ids:
-                all_jobs.append(job)
-                seen_ids.add(job["id"])
-
-        wuzzuf_jobs = scrape_wuzzuf(keyword)
-        print(f"  [Wuzzuf] Found {len(wuzzuf_jobs)} listings")
-        for job in wuzzuf_jobs:
-            if job["id"] not in seen_jobs and job["id"] not in seen_ids:
-                all_jobs.append(job)
-                seen_ids.add(job["id"])
-
-        time.sleep(2)
-
-    all_jobs.sort(key=lambda x: x.get("score", 0), reverse=True)
-
-    print(f"\nTotal new jobs found: {len(all_jobs)}")
-
-    if all_jobs:
-        send_jobs_in_chunks(all_jobs[:MAX_JOBS_PER_MESSAGE * 2], len(all_jobs))
-        print("[Telegram] Notification sent!")
-        for job in all_jobs:
-            seen_jobs.add(job["id"])
-        save_seen_jobs(seen_jobs)
-    else:
-        send_no_jobs_message()
-        print("[Telegram] No new jobs notification sent.")
+        print("Searching...")
+        jobs = stream_new_jobs(tasks, seen_jobs, new_ids, resurfaced, duplicates, near_dups, planner)
+        if enricher is not None:
+            jobs = enricher.stream(jobs)
+        for job in jobs:
+            top_jobs.push(job)
+
+        # Jobs rejected on their description stay in new_ids so they're marked
+        # seen and never fetched again, but they don't count as matches
+        rejected = enricher.rejected if enricher is not None else set()
+        total_new = len(new_ids) - len(rejected)
+
+        print(f"\nTotal new jobs found: {total_new}")
+        if duplicates:
+            print(f"Skipped {len(duplicates)} near-duplicates of jobs already found")
+        if enricher is not None:
+            print(
+                f"[Enrich] {enricher.fetched} job pages fetched, {enricher.cached} from cache, "
+                f"{len(rejected)} rejected on description"
+            )
 
+        if total_new:
+            send_jobs_in_chunks(top_jobs.best(), total_new)
+            print("[Telegram] Notification sent!")
+        else:
+            send_no_jobs_message()
+            print("[Telegram] No new jobs notification sent.")
+
+        # Marked straight after sending, so a failure below can't send these
+        # jobs again next run. Near-duplicates are marked seen too, so later
+        # runs skip them by ID
+        seen_jobs.mark_seen(new_ids | resurfaced | duplicates)
+
+        watermarks.flush()
+        if planner is not None:
+            planner.flush()
+        if near_dups is not None:
+            near_dups.flush()
+        expired = seen_jobs.expire()
+        print(f"\n[Seen] {len(seen_jobs)} job IDs tracked, {expired} expired")
+
+    CACHE.prune()
+    print(f"\n[Cache] {CACHE.hits} unchanged pages reused, {CACHE.misses} pages parsed")
+    transport.print_connection_stats()
+    SENDER.print_stats()
+    METRICS.print_summary()
+    METRICS.write()
+    print(f"[Metrics] Written to {METRICS_JSON_FILE} and {METRICS_PROM_FILE}")
     print("\nDone!")
 
 
@@ -0,0 +1,165 @@
+"""
+seen_store.py
+SQLite-backed record of job IDs already sent, replacing seen_jobs.json,
+plus the per-query pagination watermarks.
+
+Lookups hit the primary-key index instead of loading every ID into memory,
+each run writes its new IDs in one batch, and IDs that haven't shown up in
+any search for SEEN_JOBS_TTL_DAYS are expired so the file stays bounded.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from config import SEEN_JOBS_DB, SEEN_JOBS_TTL_DAYS, SEEN_JOBS_FILE
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    job_id     TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    last_seen  REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS seen_jobs_last_seen ON seen_jobs (last_seen);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# SQLite's default limit on host parameters per statement is 999
+_BATCH = 500
+
+
+class SeenJobsStore:
+    def __init__(self, path=SEEN_JOBS_DB, ttl_days=SEEN_JOBS_TTL_DAYS):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def __contains__(self, job_id):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM seen_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+
+    def seen_among(self, job_ids):
+        """The subset of job_ids already in the store, looked up in batches."""
+        job_ids = list(job_ids)
+        found = set()
+        with self._lock:
+            for i in range(0, len(job_ids), _BATCH):
+                chunk = job_ids[i:i + _BATCH]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(row[0] for row in self._conn.execute(
+                    f"SELECT job_id FROM seen_jobs WHERE job_id IN ({placeholders})", chunk
+                ))
+        return found
+
+    def mark_seen(self, job_ids, now=None):
+        """Insert new IDs and refresh last_seen on existing ones, in one transaction."""
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO seen_jobs (job_id, first_seen, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT (job_id) DO UPDATE SET last_seen = excluded.last_seen",
+                ((job_id, now, now) for job_id in job_ids),
+            )
+
+    def expire(self, now=None):
+        """Delete IDs not seen within the TTL window. Returns how many were removed."""
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM seen_jobs WHERE last_seen < ?", (now - self.ttl,)
+            )
+            return cursor.rowcount
+
+    def migrate_json(self, json_path=SEEN_JOBS_FILE):
+        """One-time import of the legacy seen_jobs.json list."""
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT 1 FROM meta WHERE key = 'migrated_json'"
+            ).fetchone()
+        if done or not os.path.exists(json_path):
+            return 0
+
+        with open(json_path, "r", encoding="utf-8") as f:
+            job_ids = json.load(f)
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_jobs (job_id, first_seen, last_seen) VALUES (?, ?, ?)",
+                ((job_id, now, now) for job_id in job_ids),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_json', ?)",
+                (str(now),),
+            )
+        return len(job_ids)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_WATERMARK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_watermarks (
+    board      TEXT NOT NULL,
+    keyword    TEXT NOT NULL,
+    location   TEXT NOT NULL,
+    job_ids    TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (board, keyword, location)
+) WITHOUT ROWID;
+"""
+
+
+class QueryWatermarks:
+    """
+    Per-query record of the listing IDs at the top of page one on the last
+    run. A later crawl of the same query can stop paginating once it reaches
+    any of them, since everything below was read last time.
+    """
+
+    def __init__(self, path=SEEN_JOBS_DB):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_WATERMARK_SCHEMA)
+        self._updates = {}
+
+    def get(self, board, keyword, location):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_ids FROM query_watermarks WHERE board = ? AND keyword = ? AND location = ?",
+                (board, keyword, location or ""),
+            ).fetchone()
+        return set(json.loads(row[0])) if row else None
+
+    def set(self, board, keyword, location, job_ids):
+        """Queue a new watermark; written by flush() at the end of the run."""
+        with self._lock:
+            self._updates[(board, keyword, location or "")] = list(job_ids)
+
+    def flush(self):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO query_watermarks "
+                "(board, keyword, location, job_ids, updated_at) VALUES (?, ?, ?, ?, ?)",
+                ((*key, json.dumps(ids), now) for key, ids in self._updates.items()),
+            )
+            self._updates.clear()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,117 @@
+"""
+supabase_client.py
+Async PostgREST client for the Supabase tables.
+
+One pooled httpx.AsyncClient per process, so bot handlers await database
+calls instead of blocking the event loop and reuse keep-alive connections.
+Every request has a timeout. Reads and idempotent writes (PATCH, DELETE)
+retry connection errors, timeouts, 429 and 5xx responses with jittered
+exponential backoff. POSTs (inserts and RPCs) are only retried when the
+request can't have reached the server: any response, even a gateway 502,
+may come after Postgres committed the write.
+"""
+
+import asyncio
+import random
+
+import httpx
+
+from config import (
+    SUPABASE_TIMEOUT_SEC, SUPABASE_CONNECT_TIMEOUT_SEC, SUPABASE_POOL_SIZE,
+    SUPABASE_MAX_RETRIES, SUPABASE_BACKOFF_BASE_SEC,
+)
+
+_IDEMPOTENT = {"GET", "HEAD", "PATCH", "DELETE"}
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class PostgrestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"PostgREST {status}: {message}")
+        self.status = status
+
+
+class PostgrestClient:
+    def __init__(self, url, key, timeout=SUPABASE_TIMEOUT_SEC,
+                 connect_timeout=SUPABASE_CONNECT_TIMEOUT_SEC, pool_size=SUPABASE_POOL_SIZE,
+                 max_retries=SUPABASE_MAX_RETRIES, backoff_base=SUPABASE_BACKOFF_BASE_SEC):
+        self.base_url = f"{url}/rest/v1"
+        self.headers = {
+            "apikey": key,
+            "Authorization": f"Bearer {key}",
+            "Content-Type": "application/json",
+            "Prefer": "return=representation",
+        }
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._client = None
+
+    def _http(self):
+        # Created on first use so it binds to the running event loop
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url, headers=self.headers,
+                timeout=self.timeout, limits=self.limits,
+            )
+        return self._client
+
+    def _backoff(self, attempt):
+        return self.backoff_base * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    async def request(self, method, table, params=None, json=None, headers=None):
+        """Send one request, retrying transient failures. Returns the httpx.Response."""
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            try:
+                response = await self._http().request(
+                    method, f"/{table}", params=params, json=json, headers=headers,
+                )
+            except _NOT_SENT:
+                if last:
+                    raise
+            except httpx.TransportError:
+                # The server may have acted on a write before the error
+                if last or method not in _IDEMPOTENT:
+                    raise
+            else:
+                if response.status_code < 400:
+                    return response
+                retryable = response.status_code == 429 or response.status_code >= 500
+                if last or method not in _IDEMPOTENT or not retryable:
+                    raise PostgrestError(response.status_code, response.text)
+            await asyncio.sleep(self._backoff(attempt))
+
+    async def select(self, table, **params):
+        response = await self.request("GET", table, params=params)
+        return response.json()
+
+    async def count(self, table, **params):
+        """Exact row count for the filters, without transferring the rows."""
+        response = await self.request(
+            "HEAD", table, params=params, headers={"Prefer": "count=exact"},
+        )
+        return int(response.headers["Content-Range"].rsplit("/", 1)[1])
+
+    async def rpc(self, function, **args):
+        """Call a Postgres function exposed by PostgREST."""
+        response = await self.request("POST", f"rpc/{function}", json=args)
+        return response.json()
+
+    async def insert(self, table, row):
+        response = await self.request("POST", table, json=row)
+        return response.json()
+
+    async def update(self, table, filters, values):
+        response = await self.request("PATCH", table, params=filters, json=values)
+        return response.json()
+
+    async def delete(self, table, filters):
+        response = await self.request("DELETE", table, params=filters)
+        return response.json()
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,174 @@
+"""
+telegram_sender.py
+Shared Telegram delivery for scraper.py, daily_question.py and weekly_summary.py.
+
+Messages are paced by token buckets — one global, one per chat — sized to
+the Bot API limits. A 429 waits out the retry_after Telegram returns, and
+5xx or network errors are retried with jittered exponential backoff, so a
+message is only dropped after TELEGRAM_MAX_RETRIES. Delivery latency is
+recorded per message and can be reported at the end of a run.
+
+The buckets belong to a sender, so the scripts get theirs from
+shared_sender(): when the scheduler runs them inside bot.py they all pace
+against the same limits.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+
+import transport
+from metrics import METRICS
+from config import (
+    TELEGRAM_API_URL, TELEGRAM_GLOBAL_RATE, TELEGRAM_CHAT_BURST,
+    TELEGRAM_SEND_DELAY_SEC, TELEGRAM_MAX_RETRIES, TELEGRAM_BACKOFF_BASE_SEC,
+)
+
+API_URL = os.environ.get("TELEGRAM_API_URL", TELEGRAM_API_URL)
+
+
+class TokenBucket:
+    """
+    Classic token bucket. Tokens may go negative: each caller reserves its
+    token immediately and sleeps off the debt, so waiters are served in
+    the order they arrived.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how many seconds until it is valid."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TelegramSender:
+    def __init__(self, token, chat_id, max_retries=TELEGRAM_MAX_RETRIES,
+                 backoff_base=TELEGRAM_BACKOFF_BASE_SEC):
+        self.token = token
+        self.chat_id = chat_id
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.global_bucket = TokenBucket(TELEGRAM_GLOBAL_RATE, TELEGRAM_GLOBAL_RATE)
+        self.chat_buckets = {}
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.retries = 0
+        self.failures = 0
+
+    def _chat_bucket(self, chat_id):
+        with self._lock:
+            bucket = self.chat_buckets.get(chat_id)
+            if bucket is None:
+                bucket = TokenBucket(1 / TELEGRAM_SEND_DELAY_SEC, TELEGRAM_CHAT_BURST)
+                self.chat_buckets[chat_id] = bucket
+            return bucket
+
+    def _backoff(self, attempt):
+        return self.backoff_base * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    async def send(self, text, chat_id=None):
+        """Deliver one message. Returns True once Telegram accepts it."""
+        chat_id = chat_id or self.chat_id
+        url = f"{API_URL}/bot{self.token}/sendMessage"
+        payload = {
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True,
+        }
+        started = time.monotonic()
+
+        for attempt in range(self.max_retries + 1):
+            await self._chat_bucket(chat_id).acquire()
+            await self.global_bucket.acquire()
+
+            try:
+                response = await asyncio.to_thread(transport.post, url, json=payload, timeout=10)
+            except Exception as e:
+                print(f"[Telegram] Error: {e}")
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code == 200:
+                    latency = time.monotonic() - started
+                    self.latencies.append(latency)
+                    METRICS.record("telegram", "sendMessage", latency)
+                    METRICS.inc("telegram_messages", result="delivered")
+                    return True
+                if response.status_code == 429:
+                    try:
+                        delay = response.json()["parameters"]["retry_after"]
+                    except (ValueError, KeyError, TypeError):
+                        delay = self._backoff(attempt)
+                    print(f"[Telegram] Rate limited — retrying in {delay}s")
+                elif response.status_code >= 500:
+                    delay = self._backoff(attempt)
+                    print(f"[Telegram] Server error {response.status_code} — retrying in {delay:.1f}s")
+                else:
+                    print(f"[Telegram] Failed: {response.text}")
+                    break
+
+            if attempt == self.max_retries:
+                break
+            self.retries += 1
+            METRICS.inc("telegram_retries")
+            await asyncio.sleep(delay)
+
+        self.failures += 1
+        METRICS.inc("telegram_messages", result="failed")
+        return False
+
+    async def send_many(self, texts, chat_id=None):
+        """Deliver messages to one chat in order. Returns how many were delivered."""
+        delivered = 0
+        for text in texts:
+            delivered += await self.send(text, chat_id)
+        return delivered
+
+    def deliver(self, texts, chat_id=None):
+        """Blocking wrapper for scripts that don't run their own event loop."""
+        return asyncio.run(self.send_many(texts, chat_id))
+
+    def reset_stats(self):
+        self.latencies = []
+        self.retries = 0
+        self.failures = 0
+
+    def print_stats(self):
+        if not self.latencies and not self.failures:
+            return
+        latencies = sorted(self.latencies)
+        line = f"[Telegram] {len(latencies)} delivered, {self.failures} failed, {self.retries} retries"
+        if latencies:
+            median = latencies[len(latencies) // 2]
+            line += f" — latency median {median:.2f}s, max {latencies[-1]:.2f}s"
+        print(line)
+
+
+_SHARED = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_sender(token, chat_id):
+    """The process-wide sender for a bot and chat, created on first use."""
+    with _SHARED_LOCK:
+        sender = _SHARED.get((token, chat_id))
+        if sender is None:
+            sender = _SHARED[(token, chat_id)] = TelegramSender(token, chat_id)
+        return sender
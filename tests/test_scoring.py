@@ -0,0 +1,45 @@
+"""
+test_scoring.py
+Regression tests for description-stage scoring.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring import REJECTED_SCORE, score_text
+
+TITLE = "Junior Python Developer"
+
+
+@pytest.mark.parametrize("description", [
+    "Please apply ASAP.",
+    "You will partner with our sales team.",
+    "Familiarity with DevOps practices is a plus.",
+    "Triage and fix bugs.",
+    "We support Emiratisation.",
+    "A key driver of our growth.",
+])
+def test_title_words_do_not_reject_descriptions(description):
+    assert score_text(TITLE, description).score > 0
+
+
+@pytest.mark.parametrize("description", [
+    "This role is open to UAE nationals only.",
+    "You have at least 3 years of experience with React.",
+])
+def test_description_phrases_reject(description):
+    assert score_text(TITLE, description).score == REJECTED_SCORE
+
+
+def test_titles_still_match_substrings():
+    assert score_text("SAP Developer").score == REJECTED_SCORE
+    assert score_text("DevOps Engineer").score == REJECTED_SCORE
+
+
+def test_description_keywords_match_whole_words():
+    assert "node" not in score_text(TITLE, "Manage cluster nodes.").matched
+    assert "node" in score_text(TITLE, "Work with Node.js.").matched
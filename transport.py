@@ -0,0 +1,397 @@
+"""
+transport.py
+Shared HTTP plumbing for the scrapers and the Telegram sender.
+Every outgoing request goes through a per-host limiter so concurrent
+searches stay polite to each job board, and reuses a pooled keep-alive
+session for that host instead of reconnecting each time. GETs also go
+through a per-host circuit breaker, so a board that starts blocking or
+failing is backed off and then dropped for the rest of the run.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from metrics import METRICS
+from config import (
+    FETCH_HOST_CONCURRENCY, FETCH_HOST_MIN_INTERVAL_SEC, FETCH_HOST_LIMITS,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_EMPTY_THRESHOLD, CIRCUIT_FAILURE_STATUSES,
+    CIRCUIT_BACKOFF_BASE_SEC, CIRCUIT_BACKOFF_MAX_SEC,
+    HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK, HTTP_MAX_RETRIES,
+)
+
+
+# ============================================================
+# PER-HOST POLITENESS LIMITS
+# ============================================================
+
+def host_of(url):
+    return urlsplit(url).netloc.lower()
+
+
+class _HostSlot:
+    def __init__(self, concurrency, min_interval):
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.semaphore = threading.BoundedSemaphore(concurrency)
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+
+
+class HostLimiter:
+    """Caps in-flight requests per host and spaces their start times."""
+
+    def __init__(self, default_concurrency=FETCH_HOST_CONCURRENCY,
+                 default_interval=FETCH_HOST_MIN_INTERVAL_SEC, limits=None):
+        self.default_concurrency = default_concurrency
+        self.default_interval = default_interval
+        self.limits = dict(FETCH_HOST_LIMITS if limits is None else limits)
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, host):
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                concurrency, interval = self.limits.get(
+                    host, (self.default_concurrency, self.default_interval)
+                )
+                slot = _HostSlot(concurrency, interval)
+                self._slots[host] = slot
+            return slot
+
+    def concurrency(self, host):
+        return self._slot(host).concurrency
+
+    def delay(self, host, seconds):
+        """Hold back the next request start to host by at least seconds from now."""
+        slot = self._slot(host)
+        with slot.lock:
+            slot.next_start = max(slot.next_start, time.monotonic() + seconds)
+
+    @contextmanager
+    def acquire(self, url):
+        slot = self._slot(host_of(url))
+        with slot.semaphore:
+            with slot.lock:
+                now = time.monotonic()
+                start = max(now, slot.next_start)
+                slot.next_start = start + slot.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+LIMITER = HostLimiter()
+
+
+# ============================================================
+# PER-HOST CIRCUIT BREAKER
+# ============================================================
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class _HostHealth:
+    def __init__(self):
+        self.failures = 0
+        self.empty_pages = 0
+        self.open = False
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failed requests and consecutive queries whose first
+    search page came back empty, per host. Each failure pushes the host's
+    next request back by a jittered exponential delay; at the threshold the
+    circuit opens and the host is skipped until the run ends (reset()).
+    """
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                 empty_threshold=CIRCUIT_EMPTY_THRESHOLD,
+                 failure_statuses=CIRCUIT_FAILURE_STATUSES,
+                 backoff_base=CIRCUIT_BACKOFF_BASE_SEC, backoff_max=CIRCUIT_BACKOFF_MAX_SEC,
+                 limiter=LIMITER):
+        self.failure_threshold = failure_threshold
+        self.empty_threshold = empty_threshold
+        self.failure_statuses = set(failure_statuses)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limiter = limiter
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Close every circuit for a new run."""
+        with self._lock:
+            self._hosts.clear()
+
+    def _health(self, host):
+        health = self._hosts.get(host)
+        if health is None:
+            health = self._hosts[host] = _HostHealth()
+        return health
+
+    def is_open(self, host):
+        with self._lock:
+            health = self._hosts.get(host)
+            return health is not None and health.open
+
+    def check(self, url):
+        host = host_of(url)
+        if self.is_open(host):
+            METRICS.inc("circuit_rejected", host=host)
+            raise CircuitOpenError(f"{host} circuit is open")
+
+    def _trip(self, host, health, reason):
+        # Called with the lock held
+        if not health.open:
+            health.open = True
+            METRICS.inc("circuit_opened", host=host)
+            print(f"  [Circuit] {host} — {reason}; skipping it for the rest of the run")
+
+    def record(self, url, response=None, retry_after=None):
+        """Record one request's outcome; response is None if it raised."""
+        host = host_of(url)
+        failed = response is None or response.status_code in self.failure_statuses \
+            or response.status_code >= 500
+        with self._lock:
+            health = self._health(host)
+            if not failed:
+                health.failures = 0
+                return
+            health.failures += 1
+            if health.failures >= self.failure_threshold:
+                self._trip(host, health, f"{health.failures} failed requests in a row")
+                return
+            backoff = min(self.backoff_max, self.backoff_base * 2 ** (health.failures - 1))
+            backoff *= random.uniform(0.5, 1.5)
+        if retry_after:
+            backoff = max(backoff, min(retry_after, self.backoff_max))
+        self.limiter.delay(host, backoff)
+
+    def record_listings(self, url, count):
+        """Record how many listings a query's first page held; repeated zeros open the circuit."""
+        host = host_of(url)
+        with self._lock:
+            health = self._health(host)
+            if count:
+                health.empty_pages = 0
+                return
+            health.empty_pages += 1
+            if health.empty_pages >= self.empty_threshold:
+                self._trip(host, health, f"{health.empty_pages} empty searches in a row")
+
+
+BREAKER = CircuitBreaker()
+
+
+def _retry_after(response):
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+# ============================================================
+# CONNECTION TIMING
+# ============================================================
+
+# Connect time of the request in flight on this thread, so it can be
+# taken out of response.elapsed to leave time to first byte
+_local = threading.local()
+
+
+class _TimedConnect:
+    """Records how long opening a connection took (DNS, TCP and TLS together)."""
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - start
+        _local.connect = getattr(_local, "connect", 0.0) + elapsed
+        # Same key as host_of() gives for the URL
+        host = self.host if self.port in (None, 80, 443) else f"{self.host}:{self.port}"
+        METRICS.record("connect", host, elapsed)
+
+
+class _TimedHTTPConnection(_TimedConnect, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnect, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+# ============================================================
+# POOLED KEEP-ALIVE SESSIONS
+# ============================================================
+
+class SessionPool:
+    """
+    One requests.Session per host, created on first use.
+    Sessions keep connections alive between requests and negotiate
+    compression through requests' default Accept-Encoding.
+    """
+
+    def __init__(self, pool_maxsize=HTTP_POOL_MAXSIZE, pool_block=HTTP_POOL_BLOCK,
+                 max_retries=HTTP_MAX_RETRIES):
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+        self._sessions = {}
+        self._lock = threading.Lock()
+        # Pool counters at the last reset_stats(); urllib3's only grow
+        self._baseline = {}
+
+    def session_for(self, url):
+        host = host_of(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = _TimedAdapter(
+                    pool_connections=1,
+                    pool_maxsize=max(self.pool_maxsize, LIMITER.concurrency(host)),
+                    pool_block=self.pool_block,
+                    max_retries=self.max_retries,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _counts(self):
+        with self._lock:
+            sessions = dict(self._sessions)
+
+        stats = {}
+        for host, session in sessions.items():
+            requests_sent = connections = 0
+            for adapter in {id(a): a for a in session.adapters.values()}.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        requests_sent += pool.num_requests
+                        connections += pool.num_connections
+            stats[host] = {"requests": requests_sent, "connections": connections}
+        return stats
+
+    def stats(self):
+        """Requests sent and connections opened per host since reset_stats(), read from urllib3's pools."""
+        stats = {}
+        for host, counts in self._counts().items():
+            base = self._baseline.get(host, {})
+            counts = {k: v - base.get(k, 0) for k, v in counts.items()}
+            if counts["requests"]:
+                stats[host] = counts
+        return stats
+
+    def reset_stats(self):
+        """Count from now on, keeping the sessions and their open connections."""
+        self._baseline = self._counts()
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._baseline = {}
+
+
+SESSIONS = SessionPool()
+
+
+def request(method, url, guarded=False, **kwargs):
+    """
+    Send a request through the host's limiter and pooled session, recording
+    first-byte and download time, status code and body size per host.
+    Guarded requests also go through the circuit breaker: they raise
+    CircuitOpenError for a skipped host and count towards its health.
+    """
+    host = host_of(url)
+    with LIMITER.acquire(url):
+        # Checked after the wait, since the circuit may have opened meanwhile
+        if guarded:
+            BREAKER.check(url)
+        _local.connect = 0.0
+        start = time.perf_counter()
+        try:
+            response = SESSIONS.session_for(url).request(method, url, **kwargs)
+        except Exception as e:
+            METRICS.inc("http_errors", host=host, error=type(e).__name__)
+            if guarded:
+                BREAKER.record(url)
+            raise
+        total = time.perf_counter() - start
+
+    # elapsed runs from sending the request until the headers are parsed;
+    # the body is read after that
+    elapsed = response.elapsed.total_seconds()
+    METRICS.record("first_byte", host, max(elapsed - _local.connect, 0.0))
+    METRICS.record("download", host, max(total - elapsed, 0.0))
+    METRICS.inc("http_responses", host=host, code=response.status_code)
+    # Bytes read off the socket (still compressed) and the decoded body, so
+    # the two show what compression saves
+    METRICS.inc("download_bytes", _wire_bytes(response), host=host)
+    METRICS.inc("body_bytes", len(response.content), host=host)
+    if guarded:
+        BREAKER.record(url, response, _retry_after(response))
+    return response
+
+
+def _wire_bytes(response):
+    # urllib3 counts what it read from the connection before decoding;
+    # fall back to the body if the response didn't come from urllib3
+    try:
+        return response.raw.tell()
+    except (AttributeError, OSError):
+        return len(response.content)
+
+
+def get(url, **kwargs):
+    """Scraper GETs are guarded by the circuit breaker."""
+    return request("GET", url, guarded=True, **kwargs)
+
+
+def post(url, **kwargs):
+    # Telegram's own retry policy lives in telegram_sender
+    return request("POST", url, **kwargs)
+
+
+def print_connection_stats():
+    stats = SESSIONS.stats()
+    if not stats:
+        return
+    print("\n[HTTP] Connection reuse per host:")
+    for host, counts in sorted(stats.items()):
+        sent, opened = counts["requests"], counts["connections"]
+        reused = sent - opened if sent > opened else 0
+        rate = round(reused / sent * 100, 1) if sent else 0
+        print(f"  {host}: {sent} requests over {opened} connections ({rate}% reused)")
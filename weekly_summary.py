@@ -1,16 +1,18 @@
 """
 weekly_summary.py
 Sends a weekly job application summary every Sunday at 9AM UAE time.
-Runs via GitHub Actions on a schedule.
+Runs on a schedule inside bot.py (scheduler.py), or by hand.
 """
 
+import asyncio
 import os
-import requests
 from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
+from env import load_env
 
-load_dotenv()
+load_env()
 
+from applications_store import remote_stats, remote_since
+from supabase_client import PostgrestClient
 from config import (
     TELEGRAM_BOT_TOKEN as _CONFIG_TOKEN,
     TELEGRAM_CHAT_ID as _CONFIG_CHAT_ID,
@@ -22,47 +24,41 @@ TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", _CONFIG_CHAT_ID)
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://gmxjjqpoehbsjtqgbdot.supabase.co")
 SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "")
 
-SUPABASE_HEADERS = {
-    "apikey": SUPABASE_KEY,
-    "Authorization": f"Bearer {SUPABASE_KEY}",
-    "Content-Type": "application/json",
-}
 
+async def _load_summary(since):
+    client = PostgrestClient(SUPABASE_URL, SUPABASE_KEY)
+    try:
+        return await asyncio.gather(remote_stats(client, since), remote_since(client, since, limit=10))
+    finally:
+        await client.close()
 
-def get_applications():
-    response = requests.get(
-        f"{SUPABASE_URL}/rest/v1/applications?order=date.desc",
-        headers=SUPABASE_HEADERS,
-        timeout=10
-    )
-    data = response.json()
-    if not isinstance(data, list):
-        print(f"[Supabase] Unexpected response: {data}")
-        return []
-    return data
+
+def get_summary(since):
+    """
+    All-time and this-week counts computed by Supabase, plus the ten newest
+    applications since since. Returns (None, []) if Supabase can't be reached.
+    """
+    try:
+        return asyncio.run(_load_summary(since))
+    except Exception as e:
+        print(f"[Supabase] Failed to load summary: {e}")
+        return None, []
 
 
 def send_telegram_message(text):
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {
-        "chat_id": TELEGRAM_CHAT_ID,
-        "text": text,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": True,
-    }
-    response = requests.post(url, json=payload, timeout=10)
-    if response.status_code != 200:
-        print(f"[Telegram] Failed: {response.text}")
-    else:
+    # Imported here so the Supabase queries don't wait on requests loading
+    from telegram_sender import shared_sender
+    if shared_sender(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID).deliver([text]):
         print("[Telegram] Weekly summary sent!")
 
 
 def main():
     print(f"Weekly Summary — {datetime.now().strftime('%d %b %Y %H:%M')}")
 
-    apps = get_applications()
+    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    stats, this_week = get_summary(week_ago)
 
-    if not apps:
+    if not stats or not stats["total"]:
         send_telegram_message(
             "📊 <b>Weekly Summary</b>\n"
             f"Week ending {datetime.now().strftime('%d %b %Y')}\n"
@@ -72,20 +68,18 @@ def main():
         )
         return
 
-    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    this_week = [a for a in apps if datetime.fromisoformat(a["date"]) > week_ago]
-
-    total = len(apps)
-    this_week_count = len(this_week)
-    interviews = len([a for a in apps if a.get("status") == "interview"])
-    rejected = len([a for a in apps if a.get("status") == "rejected"])
-    offers = len([a for a in apps if a.get("status") == "offer"])
-    pending = len([a for a in apps if a.get("status") == "applied"])
+    by_status = stats["by_status"]
+    total = stats["total"]
+    this_week_count = stats["this_week"]
+    interviews = by_status.get("interview", 0)
+    rejected = by_status.get("rejected", 0)
+    offers = by_status.get("offer", 0)
+    pending = by_status.get("applied", 0)
     interview_rate = round((interviews / total * 100), 1) if total > 0 else 0
 
     week_list = ""
     status_emoji = {"applied": "📤", "interview": "🎯", "rejected": "❌", "offer": "🎉"}
-    for app in this_week[:10]:
+    for app in this_week:
         emoji = status_emoji.get(app.get("status"), "📤")
         week_list += f"{emoji} {app['company']} — {app['role']}\n"
 